@@ -0,0 +1,130 @@
+"""
+Life, sixty-four cells at a time.
+
+A cell of the Game of Life is one bit of information, so a row of the
+board fits in a few machine words: cell c is bit c % 64 of word c // 64.
+Shifting a row one bit left or right lines every cell up with its
+neighbour, and one AND, OR or XOR then acts on sixty-four cells at once.
+
+Counting neighbours is addition, and addition is a circuit. A full
+adder takes three bits and gives their sum as two: XOR for the ones,
+majority for the twos. Run it across each row — west, self, east — and
+every cell has the count of its row's three cells in two bit-planes.
+Add the planes of the rows above and below (and the middle row without
+the cell itself), and every cell has its neighbour count written in
+binary across four bit-planes: ones, twos, fours, eights.
+
+A rule is then a question about those bits. "Exactly 3" is
+ones AND twos AND NOT fours AND NOT eights; "2 or 3" drops the ones.
+OR together the counts that give birth (for dead cells) and the counts
+that let a cell survive (for live ones) and the next generation is
+a dozen whole-array operations — no cell is looked at on its own.
+
+The board is a torus: the top row's upper neighbours are the bottom
+row, and the last column's eastern neighbour is the first, whatever
+the width.
+"""
+
+import numpy as np  # pip install numpy
+
+BITS = 64
+ONE = np.uint64(1)
+ALL = ~np.uint64(0)
+
+
+def pack(cells):
+    """A boolean (h, w) array as an (h, ⌈w/64⌉) uint64 bitboard."""
+    cells = np.asarray(cells, dtype=bool)
+    h, w = cells.shape
+    words = -(-w // BITS)
+    padded = np.zeros((h, words * BITS), dtype=bool)
+    padded[:, :w] = cells
+    bits = np.packbits(padded.reshape(h, words, BITS), axis=2,
+                       bitorder='little')
+    return bits.view('<u8').reshape(h, words).astype(np.uint64)
+
+
+def unpack(board, width):
+    """The boolean (h, width) array of a bitboard."""
+    bytes_ = np.ascontiguousarray(board, dtype='<u8').view(np.uint8)
+    bits = np.unpackbits(bytes_, axis=1, bitorder='little')
+    return bits[:, :width].astype(bool)
+
+
+def tail_mask(width):
+    """The bits of the last word of a row that are real cells."""
+    used = width - (-(-width // BITS) - 1) * BITS
+    return np.uint64((1 << used) - 1)
+
+
+def west(board, width):
+    """Each cell's western neighbour, moved into the cell's place."""
+    out = board << ONE
+    out[:, 1:] |= board[:, :-1] >> np.uint64(BITS - 1)
+    last = (width - 1) % BITS
+    out[:, 0] |= (board[:, -1] >> np.uint64(last)) & ONE
+    out[:, -1] &= tail_mask(width)
+    return out
+
+
+def east(board, width):
+    """Each cell's eastern neighbour, moved into the cell's place."""
+    out = board >> ONE
+    out[:, :-1] |= board[:, 1:] << np.uint64(BITS - 1)
+    last = (width - 1) % BITS
+    out[:, -1] &= ~(ONE << np.uint64(last))
+    out[:, -1] |= (board[:, 0] & ONE) << np.uint64(last)
+    return out
+
+
+def neighbour_counts(board, width):
+    """The eight-neighbour count of every cell as four bit-planes:
+    (ones, twos, fours, eights)."""
+    w, e = west(board, width), east(board, width)
+
+    # Row sums: all three cells (for the rows above and below) ...
+    ones3 = w ^ board ^ e
+    twos3 = (w & board) | (board & e) | (w & e)
+    # ... and the two beside the cell (for its own row)
+    ones2 = w ^ e
+    twos2 = w & e
+
+    up_ones, up_twos = np.roll(ones3, 1, axis=0), np.roll(twos3, 1, axis=0)
+    dn_ones, dn_twos = np.roll(ones3, -1, axis=0), np.roll(twos3, -1, axis=0)
+
+    # Ones column: three bits → ones plus a carry into the twos
+    ones = up_ones ^ ones2 ^ dn_ones
+    carry = (up_ones & ones2) | (ones2 & dn_ones) | (up_ones & dn_ones)
+    # Twos column: four bits (three row carries and that one)
+    t = up_twos ^ twos2 ^ dn_twos
+    fours_a = (up_twos & twos2) | (twos2 & dn_twos) | (up_twos & dn_twos)
+    twos = t ^ carry
+    fours_b = t & carry
+    fours = fours_a ^ fours_b
+    eights = fours_a & fours_b
+    return ones, twos, fours, eights
+
+
+def matching(planes, counts):
+    """Bits of the cells whose neighbour count is in counts."""
+    out = np.zeros_like(planes[0])
+    for n in counts:
+        term = np.full_like(out, ALL)
+        for plane, bit in zip(planes, (1, 2, 4, 8)):
+            term &= plane if n & bit else ~plane
+        out |= term
+    return out
+
+
+def step(board, width, birth=(3,), survive=(2, 3)):
+    """One generation of a Life-like rule on a toroidal bitboard."""
+    planes = neighbour_counts(board, width)
+    if tuple(birth) == (3,) and tuple(survive) == (2, 3):
+        # B3/S23 by hand: a count of 2 or 3 is "twos and nothing higher"
+        ones, twos, fours, eights = planes
+        out = twos & ~fours & ~eights & (ones | board)
+    else:
+        out = ((matching(planes, birth) & ~board)
+               | (matching(planes, survive) & board))
+    out[:, -1] &= tail_mask(width)
+    return out
@@ -23,9 +23,19 @@ Unlike Conway's Life, Brian's Brain never reaches a static state.
 It is always in motion.
 
 Named after Brian Silverman, who invented it in the 1980s.
+
+The step is one table lookup per cell (multistate.py): OFF cells count
+their ON neighbours, and a count of 2 is the only entry that leads
+anywhere but OFF. `python brians_brain.py big` runs a 1000 × 1000 grid.
 """
 
 import random
+import sys
+import time
+
+import numpy as np  # pip install numpy
+
+import multistate
 
 OFF, DYING, ON = 0, 1, 2
 WIDTH, HEIGHT = 79, 35
@@ -42,32 +52,22 @@ def make_grid():
     return grid
 
 
-def count_on_neighbors(grid, r, c):
-    count = 0
-    for dr in [-1, 0, 1]:
-        for dc in [-1, 0, 1]:
-            if dr == 0 and dc == 0:
-                continue
-            nr = (r + dr) % HEIGHT
-            nc = (c + dc) % WIDTH
-            if grid[nr][nc] == ON:
-                count += 1
-    return count
+def rule():
+    """(watch, table) for multistate: every state counts ON neighbours."""
+    watch, table = multistate.rule(3)
+    watch[:] = ON
+    table[OFF, :] = OFF
+    table[OFF, 2] = ON
+    table[ON, :] = DYING
+    table[DYING, :] = OFF
+    return watch, table
+
+
+RULE = rule()
 
 
 def step(grid):
-    new_grid = [[OFF] * WIDTH for _ in range(HEIGHT)]
-    for r in range(HEIGHT):
-        for c in range(WIDTH):
-            state = grid[r][c]
-            if state == ON:
-                new_grid[r][c] = DYING
-            elif state == DYING:
-                new_grid[r][c] = OFF
-            else:  # OFF
-                if count_on_neighbors(grid, r, c) == 2:
-                    new_grid[r][c] = ON
-    return new_grid
+    return multistate.step(np.array(grid), *RULE).tolist()
 
 
 def display(grid, generation):
@@ -80,7 +80,23 @@ def display(grid, generation):
     print()
 
 
+def big(size=1000, generations=200):
+    """A size × size torus at DENSITY, timed."""
+    rng = np.random.default_rng(42)
+    grid = np.where(rng.random((size, size)) < DENSITY, ON, OFF).astype(np.uint8)
+    start = time.perf_counter()
+    grid = multistate.run(grid, *RULE, generations)
+    seconds = time.perf_counter() - start
+    print(f"{size}×{size} torus, {generations} generations in {seconds:.2f} s "
+          f"({size * size * generations / seconds:,.0f} cell-updates per second)")
+    print(f"ON: {np.sum(grid == ON):,}  DYING: {np.sum(grid == DYING):,}")
+
+
 if __name__ == '__main__':
+    if sys.argv[1:] == ['big']:
+        big()
+        sys.exit()
+
     grid = make_grid()
     for gen in [0, 3, 8, 20, 50]:
         current = make_grid()
@@ -24,9 +24,18 @@ It is what the rules imply, revealed by running them.
 This is emergence in its purest form: the pattern is not in
 the description. The description is just: pick randomly, move halfway.
 The pattern is what the description does.
+
+"Move halfway to vertex v" is the affine map p → (p + v)/2, so the
+chaos game is an iterated function system with three equally likely
+maps. It is played by ifs.py, shared with fern.py.
+
+Run `python chaos_game.py hutchinson` to get the same triangle with no
+randomness at all, and to see which way is faster.
 """
 
-import random
+import sys
+
+from ifs import chaos_game, hutchinson, race
 
 W, H = 75, 38
 
@@ -38,35 +47,40 @@ VERTICES = [
 ]
 
 POINTS = 50_000
-random.seed(7)
+
+# Halfway to each vertex, as (a, b, c, d, e, f) maps — see ifs.py
+MAPS = [(0.5, 0.0, 0.0, 0.5, vx / 2, vy / 2) for vx, vy in VERTICES]
+PROBS = [1 / len(VERTICES)] * len(VERTICES)
+
+
+def density(n_points=POINTS, w=W, h=H, seed=7):
+    """How many of n_points landed in each cell of the [0, 1]² canvas."""
+    return chaos_game(MAPS, PROBS, n_points, (0.0, 1.0, 0.0, 1.0), w, h,
+                      seed=seed)
 
 
-def to_screen(x, y):
-    col = int(x * (W - 1))
-    row = int((1.0 - y) * (H - 1))
-    return col, row
+def deterministic():
+    bounds = (0.0, 1.0, 0.0, 1.0)
+    image, iterations = hutchinson(MAPS, bounds, W, H)
+
+    print("The Sierpinski Triangle — no dice\n")
+    print("  Start from a full canvas. Shrink it halfway to each vertex,")
+    print("  keep the union, repeat until nothing changes.\n")
+    for row in image:
+        print("  " + "".join("*" if cell else " " for cell in row))
+
+    r = race(MAPS, PROBS, bounds, W, H, seed=7)
+    print()
+    print(f"  Raster:      {r['iterations']} passes, "
+          f"{r['raster_pixels']:,} pixels, {r['raster_time'] * 1000:.1f} ms")
+    print(f"  Chaos game:  {r['points']:,} points, "
+          f"{r['chaos_pixels']:,} pixels, {r['chaos_time'] * 1000:.1f} ms")
+    print()
+    print("  Same triangle. The randomness was never the point.")
 
 
 def main():
-    grid = [[False] * W for _ in range(H)]
-
-    # Start anywhere
-    px, py = 0.5, 0.5
-
-    # Warm up (first few points don't lie on the attractor)
-    for _ in range(20):
-        vx, vy = random.choice(VERTICES)
-        px = (px + vx) / 2
-        py = (py + vy) / 2
-
-    # Generate and plot
-    for _ in range(POINTS):
-        vx, vy = random.choice(VERTICES)
-        px = (px + vx) / 2
-        py = (py + vy) / 2
-        col, row = to_screen(px, py)
-        if 0 <= col < W and 0 <= row < H:
-            grid[row][col] = True
+    grid = density() > 0
 
     print("The Chaos Game — Sierpinski Triangle\n")
     print(f"  {POINTS:,} points plotted.")
@@ -93,4 +107,7 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    if sys.argv[1:] == ["hutchinson"]:
+        deterministic()
+    else:
+        main()
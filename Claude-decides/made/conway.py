@@ -14,46 +14,36 @@ Turing-complete. From four rules about neighbors.
 
 Run this and watch the Gosper Glider Gun fire.
 (It runs for 200 generations then stops — hit Ctrl+C to exit early.)
+
+The board is kept as bits, 64 cells to a word, and stepped by bitlife.py.
+Run `python conway.py bench` to see how many cells it updates a second.
 """
 
 import time
 import os
 import sys
 
+import numpy as np  # pip install numpy
+
+import bitlife
+import lifelike
+
 WIDTH, HEIGHT = 80, 40
+RULE = 'B3/S23'
 
 
 def make_grid():
     return [[False] * WIDTH for _ in range(HEIGHT)]
 
 
-def count_neighbors(grid, r, c):
-    count = 0
-    for dr in [-1, 0, 1]:
-        for dc in [-1, 0, 1]:
-            if dr == 0 and dc == 0:
-                continue
-            nr, nc = (r + dr) % HEIGHT, (c + dc) % WIDTH
-            if grid[nr][nc]:
-                count += 1
-    return count
-
+def step(board):
+    """The next generation of a packed board (see bitlife.pack)."""
+    return bitlife.step(board, WIDTH, *lifelike.parse(RULE))
 
-def step(grid):
-    new_grid = make_grid()
-    for r in range(HEIGHT):
-        for c in range(WIDTH):
-            n = count_neighbors(grid, r, c)
-            if grid[r][c]:
-                new_grid[r][c] = n in (2, 3)
-            else:
-                new_grid[r][c] = n == 3
-    return new_grid
 
-
-def display(grid, generation):
+def display(board, generation):
     lines = [f" Generation {generation:>4}  (Ctrl+C to exit)\n"]
-    for row in grid:
+    for row in bitlife.unpack(board, WIDTH):
         lines.append(''.join('█' if cell else '·' for cell in row) + '\n')
     sys.stdout.write('\033[H' + ''.join(lines))
     sys.stdout.flush()
@@ -81,15 +71,32 @@ GOSPER_GLIDER_GUN = [
 ]
 
 
+def bench(size=2048, generations=50):
+    """Cell-updates per second on a random size × size torus."""
+    rng = np.random.default_rng(0)
+    board = bitlife.pack(rng.random((size, size)) < 0.3)
+    start = time.perf_counter()
+    for _ in range(generations):
+        board = bitlife.step(board, size)
+    rate = size * size * generations / (time.perf_counter() - start)
+    print(f"{size}×{size} torus, {generations} generations: "
+          f"{rate:,.0f} cell-updates per second")
+
+
 if __name__ == '__main__':
+    if sys.argv[1:] == ['bench']:
+        bench()
+        sys.exit()
+
     grid = make_grid()
     place(grid, GOSPER_GLIDER_GUN, row=5, col=2)
+    board = bitlife.pack(grid)
 
     os.system('clear')
     try:
         for gen in range(200):
-            display(grid, gen)
-            grid = step(grid)
+            display(board, gen)
+            board = step(board)
             time.sleep(0.08)
     except KeyboardInterrupt:
         pass
@@ -27,9 +27,19 @@ reactions should reach equilibrium). Confirmed 1961.
 
 The reaction had been running in the universe for billions of years.
 It was found by watching.
+
+Each state watches a different neighbour state — its own predator — so
+the step counts all N of them and lets every cell look up its own
+(multistate.py). `python cyclic_ca.py big` runs 1000 × 1000 from noise.
 """
 
 import random
+import sys
+import time
+
+import numpy as np  # pip install numpy
+
+import multistate
 
 W, H = 65, 28
 N = 3
@@ -51,20 +61,41 @@ def make_grid():
     return g
 
 
+def rule(n=N):
+    """(watch, table) for multistate: s counts its successor's cells
+    among its four neighbours, and any at all is enough."""
+    watch, table = multistate.rule(n, multistate.VON_NEUMANN)
+    for s in range(n):
+        watch[s] = (s + 1) % n
+        table[s, 1:] = (s + 1) % n
+    return watch, table
+
+
+RULE = rule()
+
+
 def step(grid):
-    new = [[0] * W for _ in range(H)]
-    for r in range(H):
-        for c in range(W):
-            s = grid[r][c]
-            t = (s + 1) % N
-            if (grid[(r-1) % H][c] == t or
-                    grid[(r+1) % H][c] == t or
-                    grid[r][(c-1) % W] == t or
-                    grid[r][(c+1) % W] == t):
-                new[r][c] = t
-            else:
-                new[r][c] = s
-    return new
+    return multistate.step(np.array(grid), *RULE,
+                           multistate.VON_NEUMANN).tolist()
+
+
+def big(size=1000, generations=300):
+    """Full random noise on a size × size torus, timed."""
+    grid = np.random.default_rng(42).integers(0, N, (size, size), dtype=np.uint8)
+    start = time.perf_counter()
+    changed = 0
+    for _ in range(generations):
+        new = multistate.step(grid, *RULE, multistate.VON_NEUMANN)
+        changed = np.count_nonzero(new != grid)
+        grid = new
+    seconds = time.perf_counter() - start
+    print(f'{size}×{size} torus, N={N}, {generations} generations '
+          f'in {seconds:.2f} s '
+          f'({size * size * generations / seconds:,.0f} cell-updates per second)')
+    print(f'{changed:,} cells changed in the last generation')
+    rows = grid[::size // 28][:28, ::size // 65][:, :65]
+    render(rows.tolist(),
+           f'every {size // 28}th row and {size // 65}th column:')
 
 
 def render(grid, label):
@@ -110,4 +141,7 @@ def main():
 
 
 if __name__ == '__main__':
+    if sys.argv[1:] == ['big']:
+        big()
+        sys.exit()
     main()
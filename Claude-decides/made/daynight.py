@@ -24,28 +24,19 @@ Day & Night has no preferred density.
 
 import random
 
+import numpy as np  # pip install numpy
+
+import lifelike
+
 DEAD, LIVE = 0, 1
 CH = {DEAD: '·', LIVE: '█'}
 
-BIRTH = {3, 6, 7, 8}
-SURVIVE = {3, 4, 6, 7, 8}
+RULE = 'B3678/S34678'
 
 
 def step(grid):
-    H, W = len(grid), len(grid[0])
-    new = [[DEAD] * W for _ in range(H)]
-    for r in range(H):
-        for c in range(W):
-            n = sum(
-                grid[(r + dr) % H][(c + dc) % W]
-                for dr in (-1, 0, 1) for dc in (-1, 0, 1)
-                if (dr, dc) != (0, 0)
-            )
-            if grid[r][c] == LIVE:
-                new[r][c] = LIVE if n in SURVIVE else DEAD
-            else:
-                new[r][c] = LIVE if n in BIRTH else DEAD
-    return new
+    new = lifelike.step(np.array(grid), RULE)
+    return np.where(new, LIVE, DEAD).tolist()
 
 
 def random_grid(W, H, density=0.5, seed=42):
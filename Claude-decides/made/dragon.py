@@ -26,25 +26,77 @@ L-system generation:
 The dragon curve grows as a sequence of right/left turns.
 At each iteration, the previous sequence is: kept, then reversed and
 flipped (L→R, R→L), then appended. This is the paper-folding rule.
+
+The folds can also be read off directly, with no sequence to build.
+The turn after segment i depends only on the bit just above the lowest
+set bit of i. The heading of segment i — how many quarter turns it has
+made in total — is the number of 1 bits in i XOR (i >> 1), its Gray
+code. And the point reached after n segments is a sum over the bits of
+n: each whole block of 2ᵏ segments is an order-k dragon, which ends at
+(1 + i)ᵏ, turned by the heading it starts at.
+
+So any stretch of the curve can be computed on its own, starting from
+its own first point. Run `python dragon.py 24` to split a 2²⁴-segment
+dragon into chunks, draw them in parallel worker processes, and add the
+pictures up.
 """
 
-import math
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np  # pip install numpy
 
 W, H = 75, 37
+CHUNK = 1 << 22         # segments per worker task
+BOUND_SAMPLES = 1 << 16  # points sampled to find the bounding box
+
+# Unit steps for headings 0-3, a quarter turn apart (walk()'s 'right turn')
+STEPS = np.array([(1, 0), (0, 1), (-1, 0), (0, -1)])
+
+
+def turn(i):
+    """True where the turn after segment i (i ≥ 1) is right."""
+    i = np.asarray(i, dtype=np.int64)
+    return ((i & -i) << 1) & i == 0
+
+
+def heading(i):
+    """Quarter turns made before segment i: popcount of its Gray code."""
+    i = np.asarray(i, dtype=np.int64)
+    return np.bitwise_count(i ^ (i >> 1)) % 4
+
+
+def position(n):
+    """The (x, y) point reached after n segments, for each n."""
+    n = np.asarray(n, dtype=np.int64)
+    x, y = np.zeros_like(n), np.zeros_like(n)
+    corner_x, corner_y = 1, 0          # (1 + i)ᵏ, the end of an order-k dragon
+    for k in range(int(n.max(initial=0)).bit_length()):
+        block = (n >> k) & 1
+        start = (n >> (k + 1)) << (k + 1)
+        q = heading(start)
+        dx = np.choose(q, [corner_x, -corner_y, -corner_x, corner_y])
+        dy = np.choose(q, [corner_y, corner_x, -corner_y, -corner_x])
+        x += block * dx
+        y += block * dy
+        corner_x, corner_y = corner_x - corner_y, corner_x + corner_y
+    return x, y
+
+
+def points(start, stop):
+    """Points start … stop of the curve as two arrays, computed from
+    scratch: no earlier part of the curve is needed."""
+    x0, y0 = position(start)
+    step = STEPS[heading(np.arange(start, stop))]
+    x = np.concatenate([[x0], x0 + np.cumsum(step[:, 0])])
+    y = np.concatenate([[y0], y0 + np.cumsum(step[:, 1])])
+    return x, y
 
 
 def dragon_turns(order):
     """Generate the sequence of turns: True=right, False=left."""
-    turns = []
-    for i in range(1, 2**order):
-        # The turn at position i is determined by: find highest power of 2
-        # dividing i, then look at the bit above it.
-        # Equivalently: turns[i] = 1 if (i >> (bit+1)) & 1 == 0
-        k = i
-        while k % 2 == 0:
-            k //= 2
-        turns.append(((k >> 1) & 1) == 0)
-    return turns
+    return turn(np.arange(1, 2**order)).tolist()
 
 
 def walk(turns):
@@ -116,6 +168,59 @@ def render(path, order):
     print()
 
 
+def bounds(order):
+    """(min_x, max_x, min_y, max_y) of the order-n curve.
+
+    Taken from every stride-th point, widened by the farthest any
+    stretch of stride segments can wander from its first point.
+    """
+    stride = max(1, 2**order // BOUND_SAMPLES)
+    x, y = position(np.arange(0, 2**order + 1, stride))
+    sx, sy = points(0, stride)
+    reach = int(np.ceil(np.hypot(sx, sy).max()))
+    return (x.min() - reach, x.max() + reach,
+            y.min() - reach, y.max() + reach)
+
+
+def chunk_density(start, stop, box, w, h):
+    """How many of points start … stop-1 land in each of w × h cells.
+    Runs in a worker process."""
+    x, y = points(start, stop - 1)
+    min_x, max_x, min_y, max_y = box
+    ASPECT = 2.0
+    scale = min((w - 1) / (max_x - min_x or 1),
+                (h - 1) / ((max_y - min_y or 1) * ASPECT))
+    col = ((x - min_x) * scale).astype(np.intp)
+    row = ((max_y - y) * scale * ASPECT).astype(np.intp)
+    seen = (col >= 0) & (col < w) & (row >= 0) & (row < h)
+    return np.bincount(row[seen] * w + col[seen], minlength=h * w).reshape(h, w)
+
+
+def density(order, w=W, h=H, chunk=CHUNK, workers=None):
+    """Points of the order-n curve per cell, with the curve cut into
+    chunks drawn in parallel and summed."""
+    box = bounds(order)
+    total = 2**order + 1
+    starts = list(range(0, total, chunk))
+    stops = [min(start + chunk, total) for start in starts]
+    grid = np.zeros((h, w), dtype=np.int64)
+    with ProcessPoolExecutor(workers or os.cpu_count()) as pool:
+        for part in pool.map(chunk_density, starts, stops,
+                             [box] * len(starts), [w] * len(starts),
+                             [h] * len(starts)):
+            grid += part
+    return grid
+
+
+def render_density(grid, order):
+    CHARS = ' ·░▒▓█'
+    levels = np.log1p(grid) / np.log1p(grid.max() or 1)
+    print(f'  Order {order}:  {2**order:,} segments')
+    for row in np.ceil(levels * (len(CHARS) - 1)).astype(int):
+        print('  ' + ''.join(CHARS[i] for i in row))
+    print()
+
+
 def main():
     print('Dragon Curve\n')
     print('  Fold a strip of paper in half, always the same direction.')
@@ -141,4 +246,8 @@ def main():
 
 
 if __name__ == '__main__':
-    main()
+    if sys.argv[1:]:
+        order = int(sys.argv[1])
+        render_density(density(order), order)
+    else:
+        main()
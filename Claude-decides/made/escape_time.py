@@ -0,0 +1,229 @@
+"""
+Escape time, for a whole picture at once.
+
+mandelbrot.py and julia.py ask the same question of every pixel:
+iterate z → z² + c and count the steps until |z| passes 2.
+The Mandelbrot set starts every orbit at 0 and varies c;
+a Julia set fixes c and varies the starting point.
+Same loop, different axis.
+
+So the loop lives here, once, and runs over arrays instead of points.
+Every pixel takes one step together. The pixels that escape are
+written down and dropped, so the work shrinks as the picture resolves —
+by the last iterations only the set itself (and its near misses)
+is still being computed.
+
+The points that never escape are the expensive ones: each costs the
+full max_iter. Two shortcuts spare most of them. The main cardioid and
+the period-2 bulb of the Mandelbrot set have closed forms, so c inside
+them can be marked before iterating at all (in_main_bulbs). For the
+rest, an orbit that has settled onto a cycle will come back to where
+it was; Brent's trick is to remember z at every power-of-two step and
+stop as soon as the orbit returns to it.
+
+Large renders have another shortcut. The escape-time picture is made of
+bands, and a rectangle whose whole border lies in one band almost always
+lies in it entirely (the set is connected, and so are its level sets).
+subdivided_counts() computes only borders, filling a rectangle when its
+border agrees and cutting it into four when it doesn't — the
+Mariani–Silver algorithm.
+
+Filaments thinner than a pixel fall between samples and vanish unless
+max_iter is pushed very high. escape_distances() carries the derivative
+of z along each orbit as well, which gives an estimate of how far an
+escaping point is from the set: 2·|z|·ln|z| / |z'|. A pixel closer to
+the set than its own width is on the boundary, whatever its count.
+"""
+
+import numpy as np  # pip install numpy
+
+# How close an orbit must come back to its remembered point to count as a cycle
+PERIOD_TOL = 1e-12
+
+
+def plane(x_min, x_max, y_min, y_max, w, h, endpoint=True):
+    """A (h, w) grid of complex points, top row at y_max.
+
+    With endpoint=False the right and bottom edges are left out,
+    the way mandelbrot.py has always sampled its viewport.
+    """
+    xs = np.linspace(x_min, x_max, w, endpoint=endpoint)
+    ys = np.linspace(y_max, y_min, h, endpoint=endpoint)
+    return xs[np.newaxis, :] + 1j * ys[:, np.newaxis]
+
+
+def in_main_bulbs(c):
+    """True where c lies in the main cardioid or the period-2 bulb."""
+    c = np.asarray(c, dtype=complex)
+    x, y = c.real, c.imag
+    q = (x - 0.25) ** 2 + y * y
+    cardioid = q * (q + (x - 0.25)) <= 0.25 * y * y
+    bulb = (x + 1) ** 2 + y * y <= 0.0625
+    return cardioid | bulb
+
+
+def escape_counts(z0, c, max_iter, bailout=2.0, interior=None,
+                  periodicity=True, stats=None):
+    """Iterations of z → z² + c before |z| > bailout, per point.
+
+    z0 and c are anything that broadcasts together: a grid of starting
+    points with one c (Julia), or 0 with a grid of c (Mandelbrot).
+    Points that never escape get max_iter.
+
+    interior marks points already known to be bounded; they are not
+    iterated. With periodicity, orbits caught repeating are stopped
+    early. If stats is a dict, it receives the number of point-iterations
+    performed ('iterations') and the number skipped ('saved').
+    """
+    z0 = np.asarray(z0, dtype=complex)
+    c = np.asarray(c, dtype=complex)
+    shape = np.broadcast_shapes(z0.shape, c.shape)
+    size = int(np.prod(shape))
+
+    counts = np.full(size, max_iter, dtype=np.int32)
+    if interior is None:
+        active = np.arange(size)
+    else:
+        active = np.flatnonzero(~np.broadcast_to(interior, shape).ravel())
+    z = np.broadcast_to(z0, shape).ravel()[active]
+    c = np.broadcast_to(c, shape).ravel()[active]
+
+    remembered = z.copy()
+    remember_at = 1
+    performed = 0
+
+    for i in range(max_iter):
+        done = np.abs(z) > bailout
+        counts[active[done]] = i
+        if periodicity:
+            if i == remember_at:
+                remembered = z.copy()
+                remember_at *= 2
+            elif i:
+                done |= np.abs(z - remembered) < PERIOD_TOL
+        if done.any():
+            keep = ~done
+            active, z, c = active[keep], z[keep], c[keep]
+            remembered = remembered[keep]
+            if active.size == 0:
+                break
+        performed += active.size
+        z *= z
+        z += c
+
+    if stats is not None:
+        stats['iterations'] = performed
+        stats['saved'] = int(counts.sum()) - performed
+    return counts.reshape(shape)
+
+
+def escape_distances(z0, c, max_iter, wrt='c', bailout=1e3, interior=None):
+    """Escape counts and estimated distances to the set, per point.
+
+    wrt='c' measures distance in the parameter plane (the Mandelbrot
+    set); wrt='z' measures it in the plane of starting points (a Julia
+    set). Points that never escape get max_iter and distance 0.
+    The large bailout makes the estimate accurate; counts run a little
+    higher than with escape_counts.
+    """
+    z0 = np.asarray(z0, dtype=complex)
+    c = np.asarray(c, dtype=complex)
+    shape = np.broadcast_shapes(z0.shape, c.shape)
+    size = int(np.prod(shape))
+
+    counts = np.full(size, max_iter, dtype=np.int32)
+    dist = np.zeros(size)
+    if interior is None:
+        active = np.arange(size)
+    else:
+        active = np.flatnonzero(~np.broadcast_to(interior, shape).ravel())
+    z = np.broadcast_to(z0, shape).ravel()[active]
+    c = np.broadcast_to(c, shape).ravel()[active]
+    dz = np.full(z.size, 0j if wrt == 'c' else 1 + 0j)
+    step = 1 if wrt == 'c' else 0
+
+    for i in range(max_iter):
+        az = np.abs(z)
+        done = az > bailout
+        if done.any():
+            where = active[done]
+            counts[where] = i
+            dist[where] = 2 * az[done] * np.log(az[done]) / np.abs(dz[done])
+            keep = ~done
+            active, z, c, dz = active[keep], z[keep], c[keep], dz[keep]
+            if active.size == 0:
+                break
+        dz = 2 * z * dz + step
+        z *= z
+        z += c
+
+    return counts.reshape(shape), dist.reshape(shape)
+
+
+def subdivided_counts(z0, c, max_iter, min_size=8, interior=None, stats=None,
+                      **kwargs):
+    """escape_counts over a 2-D grid, computing only rectangle borders.
+
+    A rectangle whose border is all one count is filled with it; one
+    smaller than min_size on a side is computed outright; anything else
+    is split in four. Each level of the subdivision is one call to
+    escape_counts. If stats is a dict it gets 'iterations' and 'saved'
+    as there, plus 'skipped': the fraction of pixels filled unseen.
+    """
+    z0, c = np.broadcast_arrays(np.asarray(z0, dtype=complex),
+                                np.asarray(c, dtype=complex))
+    h, w = z0.shape
+    if interior is not None:
+        interior = np.broadcast_to(interior, (h, w))
+    counts = np.full((h, w), -1, dtype=np.int32)
+    performed = filled = 0
+
+    def compute(want):
+        nonlocal performed
+        flat = np.flatnonzero(want & (counts < 0))
+        if flat.size == 0:
+            return
+        r, q = np.divmod(flat, w)
+        part = {}
+        inside = None if interior is None else interior[r, q]
+        counts[r, q] = escape_counts(z0[r, q], c[r, q], max_iter,
+                                     interior=inside, stats=part, **kwargs)
+        performed += part['iterations']
+
+    def uniform(y0, y1, x0, x1):
+        first = counts[y0, x0]
+        return ((counts[y0, x0:x1 + 1] == first).all()
+                and (counts[y1, x0:x1 + 1] == first).all()
+                and (counts[y0:y1 + 1, x0] == first).all()
+                and (counts[y0:y1 + 1, x1] == first).all())
+
+    rects = [(0, h - 1, 0, w - 1)]
+    while rects:
+        want = np.zeros((h, w), dtype=bool)
+        for y0, y1, x0, x1 in rects:
+            want[(y0, y1), x0:x1 + 1] = True
+            want[y0:y1 + 1, (x0, x1)] = True
+        compute(want)
+
+        split = []
+        want[:] = False
+        for y0, y1, x0, x1 in rects:
+            if y1 - y0 < 2 or x1 - x0 < 2:
+                continue
+            if uniform(y0, y1, x0, x1):
+                counts[y0 + 1:y1, x0 + 1:x1] = counts[y0, x0]
+                filled += (y1 - y0 - 1) * (x1 - x0 - 1)
+            elif y1 - y0 <= min_size or x1 - x0 <= min_size:
+                want[y0 + 1:y1, x0 + 1:x1] = True
+            else:
+                ym, xm = (y0 + y1) // 2, (x0 + x1) // 2
+                split += [(y0, ym, x0, xm), (y0, ym, xm, x1),
+                          (ym, y1, x0, xm), (ym, y1, xm, x1)]
+        compute(want)
+        rects = split
+
+    if stats is not None:
+        stats['iterations'] = performed
+        stats['saved'] = int(counts.sum()) - performed
+        stats['skipped'] = filled / counts.size
+    return counts
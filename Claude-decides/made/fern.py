@@ -25,9 +25,18 @@ After enough iterations, the plotted points form the fern.
 This is the strange economy of fractals: the fern is four matrix equations.
 The equations ARE the fern, in some deep sense. The fern you see in a forest
 is a particular physical instance of something that can be stated in forty numbers.
+
+The game itself is played by ifs.py, shared with chaos_game.py: many
+points at once, counted into the canvas as they land.
+
+Run `python fern.py hutchinson` for the fern without dice: the four
+maps applied to the whole canvas at once until it stops changing,
+timed against the chaos game.
 """
 
-import random
+import sys
+
+from ifs import attractor_bounds, chaos_game, hutchinson, race
 
 # Canvas
 W, H = 65, 55
@@ -44,57 +53,53 @@ TRANSFORMS = [
 ]
 
 
-def pick_transform():
-    r = random.random()
-    cumulative = 0.0
-    for *coeffs, prob in TRANSFORMS:
-        cumulative += prob
-        if r < cumulative:
-            return coeffs
-    return TRANSFORMS[-1][:-1]
+MAPS = [t[:6] for t in TRANSFORMS]
+PROBS = [t[6] for t in TRANSFORMS]
 
 
-def iterate(n_points):
-    x, y = 0.0, 0.0
-    points = []
-    for _ in range(n_points):
-        a, b, c, d, e, f = pick_transform()
-        x, y = a * x + b * y + e, c * x + d * y + f
-        points.append((x, y))
-    return points
+def fern_bounds():
+    """The fern's bounding box, with a little margin."""
+    x_min, x_max, y_min, y_max = attractor_bounds(MAPS, PROBS)
+    x_margin = (x_max - x_min) * 0.05
+    y_margin = (y_max - y_min) * 0.02
+    return x_min - x_margin, x_max + x_margin, y_min - y_margin, y_max + y_margin
 
 
-def render(points, w=W, h=H):
-    # Find bounding box
-    xs = [p[0] for p in points]
-    ys = [p[1] for p in points]
-    x_min, x_max = min(xs), max(xs)
-    y_min, y_max = min(ys), max(ys)
+def density(n_points=N_POINTS, w=W, h=H, seed=42):
+    """How many of n_points landed in each cell of the canvas."""
+    return chaos_game(MAPS, PROBS, n_points, fern_bounds(), w, h, seed=seed)
 
-    # Add margin
-    x_margin = (x_max - x_min) * 0.05
-    y_margin = (y_max - y_min) * 0.02
-    x_min -= x_margin; x_max += x_margin
-    y_min -= y_margin; y_max += y_margin
 
-    grid = [[' '] * w for _ in range(h)]
-    for x, y in points:
-        col = int((x - x_min) / (x_max - x_min) * (w - 1))
-        row = int((y_max - y) / (y_max - y_min) * (h - 1))
-        if 0 <= col < w and 0 <= row < h:
-            grid[row][col] = '█'
+def render(hist):
+    return [['█' if n else ' ' for n in row] for row in hist]
+
 
-    return grid
+def deterministic():
+    """The fern by the Hutchinson operator, and the race against dice."""
+    image, iterations = hutchinson(MAPS, fern_bounds(), W, H)
+    print("Barnsley's Fern — no dice")
+    print("All four maps applied to every lit pixel, until nothing changes.\n")
+    for row in render(image):
+        print('  ' + ''.join(row))
+    r = race(MAPS, PROBS, fern_bounds(), W, H, seed=42)
+    print()
+    print(f"  Raster:      {r['iterations']} passes, "
+          f"{r['raster_pixels']:,} pixels, {r['raster_time'] * 1000:.1f} ms")
+    print(f"  Chaos game:  {r['points']:,} points, "
+          f"{r['chaos_pixels']:,} pixels, {r['chaos_time'] * 1000:.1f} ms")
+    print()
+    print("  The stem map is taken 1% of the time; the raster takes it every pass.")
 
 
 if __name__ == '__main__':
-    random.seed(42)
+    if sys.argv[1:] == ['hutchinson']:
+        deterministic()
+        sys.exit()
 
     print("Barnsley's Fern — Iterated Function System")
     print("Four matrix transformations. Applied randomly. Result: a fern.\n")
 
-    points = iterate(N_POINTS)
-    grid = render(points)
+    grid = render(density(N_POINTS))
 
     for row in grid:
         print('  ' + ''.join(row))
@@ -0,0 +1,286 @@
+"""
+HashLife — skipping to the far future of the Game of Life.
+
+Bill Gosper's algorithm (1984). The plane is a quadtree: a square of
+side 2ᵏ is four squares of side 2ᵏ⁻¹, down to single cells. Every
+square that occurs is stored once — two identical patches anywhere in
+the plane, at any time, are the same node — so a glider stream a
+billion gliders long is a few dozen nodes repeated.
+
+Then the trick. What a square of side 2ᵏ will look like in its centre
+2ᵏ⁻² generations from now depends only on the square: nothing from
+outside can reach the centre in that time. So each node remembers that
+answer once it is worked out, and works it out from the answers of its
+own sub-squares, two half-leaps at a time. A pattern that repeats itself
+in space and time is computed once and looked up ever after, and the
+leaps double in length with each level: generation 10¹² is about forty
+levels up.
+
+The node table grows with everything ever seen, so it is kept to a
+budget, checked every so often while a leap is being worked out. A leap
+that would go over is abandoned: the table is rebuilt from the current
+pattern alone, the remembered answers are forgotten, and the same leap
+is tried again. If it still does not fit, the same stretch of time is
+covered in two leaps half as long, which need less, and leaps stay that
+short from then on. The one thing the budget cannot shrink is the
+pattern itself: if a single generation will not fit, the budget is
+doubled.
+
+Patterns are (row, col) offsets, as everywhere else in this folder;
+x is the column and y the row, growing downward. The universe stays
+centred on the origin however far it grows.
+"""
+
+import sys
+
+import numpy as np  # pip install numpy
+
+MAX_BYTES = 512 * 2 ** 20   # default budget for nodes and remembered results
+CHECK_EVERY = 1024          # new results between looks at the budget
+
+
+class Node:
+    """A square of side 2**level, made of four squares one level down."""
+
+    __slots__ = ('level', 'nw', 'ne', 'sw', 'se', 'population')
+
+    def __init__(self, level, nw, ne, sw, se, population):
+        self.level = level
+        self.nw, self.ne, self.sw, self.se = nw, ne, sw, se
+        self.population = population
+
+
+DEAD = Node(0, None, None, None, None, 0)
+ALIVE = Node(0, None, None, None, None, 1)
+
+
+class OverBudget(Exception):
+    """A leap has filled the node table past its budget."""
+
+
+class HashLife:
+    """A Life universe on the unbounded plane, stepped by HashLife."""
+
+    def __init__(self, cells=(), max_bytes=MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.table = {}
+        self.results = {}
+        self.empties = [DEAD]
+        self.hits = self.misses = 0
+        self.collections = 0
+        self.limit = max_bytes
+        self.longest = None     # longest leap (as j) known to fit, once one didn't
+        self.fresh = True       # nothing remembered since the table was rebuilt
+        self.generation = 0
+        self.root = self.empty(3)
+        for row, col in cells:
+            self.set(col, row)
+
+    # --- building nodes ---
+
+    def join(self, nw, ne, sw, se):
+        """The one node with these four quadrants."""
+        key = (nw, ne, sw, se)
+        node = self.table.get(key)
+        if node is None:
+            node = Node(nw.level + 1, nw, ne, sw, se,
+                        nw.population + ne.population
+                        + sw.population + se.population)
+            self.table[key] = node
+        return node
+
+    def empty(self, level):
+        while len(self.empties) <= level:
+            e = self.empties[-1]
+            self.empties.append(self.join(e, e, e, e))
+        return self.empties[level]
+
+    def expand(self, node):
+        """The same pattern, centred in a square twice the size."""
+        e = self.empty(node.level - 1)
+        return self.join(self.join(e, e, e, node.nw),
+                         self.join(e, e, node.ne, e),
+                         self.join(e, node.sw, e, e),
+                         self.join(node.se, e, e, e))
+
+    def centre(self, node):
+        return self.join(node.nw.se, node.ne.sw, node.sw.ne, node.se.nw)
+
+    def set(self, x, y, alive=True):
+        """Make the cell at (x, y) alive (or dead)."""
+        while not (-(1 << (self.root.level - 1)) <= min(x, y)
+                   and max(x, y) < 1 << (self.root.level - 1)):
+            self.root = self.expand(self.root)
+
+        def put(node, x, y):
+            # (x, y) measured from node's top-left corner
+            if node.level == 0:
+                return ALIVE if alive else DEAD
+            half = 1 << (node.level - 1)
+            quads = [node.nw, node.ne, node.sw, node.se]
+            q = (y >= half) * 2 + (x >= half)
+            quads[q] = put(quads[q], x % half, y % half)
+            return self.join(*quads)
+
+        half = 1 << (self.root.level - 1)
+        self.root = put(self.root, x + half, y + half)
+
+    # --- stepping ---
+
+    def base(self, node):
+        """The centre 2×2 of a 4×4 node, one generation on."""
+        cells = [[0] * 4 for _ in range(4)]
+        for qy, qx, q in ((0, 0, node.nw), (0, 2, node.ne),
+                          (2, 0, node.sw), (2, 2, node.se)):
+            for dy, dx, c in ((0, 0, q.nw), (0, 1, q.ne),
+                              (1, 0, q.sw), (1, 1, q.se)):
+                cells[qy + dy][qx + dx] = c.population
+        out = []
+        for y in (1, 2):
+            for x in (1, 2):
+                n = sum(cells[y + dy][x + dx]
+                        for dy in (-1, 0, 1) for dx in (-1, 0, 1)) - cells[y][x]
+                out.append(ALIVE if n == 3 or (n == 2 and cells[y][x])
+                           else DEAD)
+        return self.join(*out)
+
+    def successor(self, node, j):
+        """The centre of node (level k ≥ 2), 2**j generations on (j ≤ k-2)."""
+        key = (node, j)
+        result = self.results.get(key)
+        if result is not None:
+            self.hits += 1
+            return result
+        self.misses += 1
+        if self.misses % CHECK_EVERY == 0 and self.memory() > self.limit:
+            raise OverBudget
+
+        if node.population == 0:
+            result = node.nw
+        elif node.level == 2:
+            result = self.base(node)
+        else:
+            nw, ne, sw, se = node.nw, node.ne, node.sw, node.se
+            join = self.join
+            nine = [nw, join(nw.ne, ne.nw, nw.se, ne.sw), ne,
+                    join(nw.sw, nw.se, sw.nw, sw.ne), self.centre(node),
+                    join(ne.sw, ne.se, se.nw, se.ne),
+                    sw, join(sw.ne, se.nw, sw.se, se.sw), se]
+            if j == node.level - 2:
+                # Full leap: two half-leaps, through the nine overlapping squares
+                nine = [self.successor(n, j - 1) for n in nine]
+                second = j - 1
+            else:
+                # Shorter: just the centres, then one leap of 2**j
+                nine = [self.centre(n) for n in nine]
+                second = j
+            a, b, c, d, e, f, g, h, i = nine
+            result = join(self.successor(join(a, b, d, e), second),
+                          self.successor(join(b, c, e, f), second),
+                          self.successor(join(d, e, g, h), second),
+                          self.successor(join(e, f, h, i), second))
+        self.results[key] = result
+        return result
+
+    def padded(self, node):
+        """True if all of node's cells lie in the central square a
+        quarter of its width."""
+        return (node.level >= 3 and node.population
+                == node.nw.se.se.population + node.ne.sw.sw.population
+                + node.sw.ne.ne.population + node.se.nw.nw.population)
+
+    def leap(self, j):
+        """Advance 2**j generations, in shorter leaps if need be."""
+        if self.longest is not None and j > self.longest:
+            self.leap(j - 1)
+            self.leap(j - 1)
+            return
+        while self.root.level < j + 3 or not self.padded(self.root):
+            self.root = self.expand(self.root)
+        try:
+            self.root = self.successor(self.root, j)
+        except OverBudget:
+            fresh = self.fresh
+            self.collect()
+            if not fresh:
+                # Perhaps just the leftovers of earlier leaps: try again
+                self.leap(j)
+            elif j == 0:
+                # Even one generation doesn't fit: the budget has to give
+                self.limit *= 2
+                self.leap(0)
+            else:
+                self.longest = j - 1
+                self.leap(j - 1)
+                self.leap(j - 1)
+            return
+        self.generation += 1 << j
+        self.fresh = False
+
+    def advance(self, generations):
+        """Advance any number of generations, one leap per set bit."""
+        j = 0
+        while generations:
+            if generations & 1:
+                self.leap(j)
+            generations >>= 1
+            j += 1
+
+    # --- bookkeeping ---
+
+    def memory(self):
+        """Approximate bytes held by the node table and the results."""
+        node = sys.getsizeof(DEAD)
+        return (sys.getsizeof(self.table) + sys.getsizeof(self.results)
+                + len(self.table) * (node + 64)
+                + len(self.results) * 64)
+
+    def collect(self):
+        """Rebuild the node table from the current pattern; forget results."""
+        keep = {}
+        stack = [self.root] + self.empties[1:]
+        while stack:
+            node = stack.pop()
+            if node.level == 0:
+                continue
+            key = (node.nw, node.ne, node.sw, node.se)
+            if key not in keep:
+                keep[key] = node
+                stack.extend(key)
+        self.table = keep
+        self.results = {}
+        self.collections += 1
+        self.fresh = True
+
+    def stats(self):
+        looked = self.hits + self.misses
+        return {'nodes': len(self.table), 'results': len(self.results),
+                'hit_rate': self.hits / looked if looked else 0.0,
+                'bytes': self.memory(), 'collections': self.collections}
+
+    @property
+    def population(self):
+        return self.root.population
+
+    def window(self, row0, col0, h, w):
+        """The h × w boolean array of cells from (row0, col0)."""
+        out = np.zeros((h, w), dtype=bool)
+        x0, y0 = col0, row0
+
+        def visit(node, x, y):
+            size = 1 << node.level
+            if (node.population == 0 or x >= x0 + w or y >= y0 + h
+                    or x + size <= x0 or y + size <= y0):
+                return
+            if node.level == 0:
+                out[y - y0, x - x0] = True
+                return
+            half = size // 2
+            visit(node.nw, x, y)
+            visit(node.ne, x + half, y)
+            visit(node.sw, x, y + half)
+            visit(node.se, x + half, y + half)
+
+        half = 1 << (self.root.level - 1)
+        visit(self.root, -half, -half)
+        return out
@@ -12,44 +12,38 @@ of themselves and continue doing so). HighLife does. This matters:
 self-replication is considered the key property for open-ended
 evolution. HighLife can, in principle, evolve in a way Life cannot.
 
-The replicator is a specific 7-cell pattern. After some generations,
-it produces two copies of itself, then four, then eight, doubling
-each period. The grid fills with replicators.
+The replicator is a specific 12-cell pattern. Every 12 generations
+each copy makes two more, one on either side along a diagonal; where
+two copies meet, they cancel. The number of copies goes 1, 2, 2, 4,
+2, 4, 4, 8, … — the same pattern as Rule 90.
 
 Below: first, a standard Life glider (which also works in HighLife
 since the survival rules are identical), then a random start to
 show HighLife's character, then the replicator itself.
+
+The replicator runs on the unbounded plane (sparselife.py), so its
+copies never meet an edge. Run `python highlife.py long` to let them
+multiply for a few hundred generations.
 """
 
 import random
+import sys
+import time
+
+import numpy as np  # pip install numpy
+
+import lifelike
+from sparselife import SparseLife
 
 EMPTY, LIVE = 0, 1
 CH = {EMPTY: '·', LIVE: '█'}
 
+RULE = 'B36/S23'
+
 
 def step_highlife(grid, torus=True):
-    H, W = len(grid), len(grid[0])
-    new = [[EMPTY] * W for _ in range(H)]
-    for r in range(H):
-        for c in range(W):
-            if torus:
-                neighbors = sum(
-                    grid[(r+dr) % H][(c+dc) % W]
-                    for dr in (-1, 0, 1) for dc in (-1, 0, 1)
-                    if (dr, dc) != (0, 0)
-                )
-            else:
-                neighbors = sum(
-                    grid[r+dr][c+dc]
-                    for dr in (-1, 0, 1) for dc in (-1, 0, 1)
-                    if (dr, dc) != (0, 0)
-                    and 0 <= r+dr < H and 0 <= c+dc < W
-                )
-            if grid[r][c] == LIVE:
-                new[r][c] = LIVE if neighbors in (2, 3) else EMPTY
-            else:
-                new[r][c] = LIVE if neighbors in (3, 6) else EMPTY
-    return new
+    new = lifelike.step(np.array(grid), RULE, torus=torus)
+    return np.where(new, LIVE, EMPTY).tolist()
 
 
 def blank(W=80, H=30):
@@ -76,20 +70,25 @@ def run(grid, steps, torus=True):
     return grid
 
 
+def plane(universe, W, H):
+    """The W × H corner of an unbounded universe at (0, 0), as a grid."""
+    return [[LIVE if c else EMPTY for c in row]
+            for row in universe.window(0, 0, H, W).tolist()]
+
+
 # ── The HighLife replicator ───────────────────────────────────────────────────
-# A 12-cell pattern that duplicates itself every 12 generations.
-# After 12 steps: two copies. After 24: four. After 36: eight.
+# A 12-cell pattern that copies itself every 12 generations. The copies
+# spread along a diagonal, and where two meet they cancel, so the count
+# goes 1, 2, 2, 4, 2, 4, 4, 8 … like Rule 90.
 #
-# In RLE notation (from LifeWiki): 3b2o$2bobo$bobo$2obo$bo2bo$2b2o
-# This is the canonical HighLife replicator.
+# In RLE notation (from LifeWiki): 2b3o$bo2bo$o3bo$o2bo$3o
 
 REPLICATOR = [
-    (0,3),(0,4),
-    (1,2),(1,4),
-    (2,1),(2,3),
-    (3,0),(3,1),(3,3),
-    (4,1),(4,4),
-    (5,2),(5,3),
+    (0,2),(0,3),(0,4),
+    (1,1),(1,4),
+    (2,0),(2,4),
+    (3,0),(3,3),
+    (4,0),(4,1),(4,2),
 ]
 
 
@@ -102,7 +101,28 @@ GLIDER = [
 ]
 
 
+def long_run(generations=3072):
+    """Replicators multiplying on the unbounded plane, with tile stats."""
+    universe = SparseLife(REPLICATOR, *lifelike.parse(RULE))
+    print(f'HighLife replicator, {generations} generations, unbounded plane\n')
+    start = time.perf_counter()
+    for _ in range(generations // 384):
+        universe.run(384)
+        print(f'  gen {universe.generation:>4}:  {universe.population:>6,} cells'
+              f'  in {len(universe.tiles):>4} tiles')
+    seconds = time.perf_counter() - start
+    row0, row1, col0, col1 = universe.bounds()
+    area = (row1 - row0 + 1) * (col1 - col0 + 1)
+    swept = universe.stepped * universe.tile ** 2
+    print(f'\n  {seconds:.2f} s.  Stepped {swept:,} cells in all; sweeping the '
+          f'final bounding box every generation would be {area * generations:,}.')
+
+
 if __name__ == '__main__':
+    if sys.argv[1:] == ['long']:
+        long_run()
+        sys.exit()
+
     print('HighLife — B36/S23')
     print('Same as Conway\'s Life except: dead cell with 6 neighbors also births.')
     print('This adds self-replicating patterns — something Life lacks.\n')
@@ -120,10 +140,13 @@ if __name__ == '__main__':
     # Demo 2: the replicator (non-toroidal so copies don't wrap and interfere)
     print('─' * 50)
     print('The HighLife replicator — this pattern copies itself:\n')
-    g = blank(110, 60)
-    place(g, REPLICATOR, 27, 52)
-    show(g, 'step 0 — one replicator (12 cells)')
-    g = run(g, 12, torus=False)
-    show(g, 'step 12 — two copies')
-    g = run(g, 12, torus=False)
-    show(g, 'step 24 — four copies')
+    universe = SparseLife([(10 + r, 16 + c) for r, c in REPLICATOR],
+                          *lifelike.parse(RULE))
+    show(plane(universe, 40, 26), 'step 0 — one replicator (12 cells)')
+    universe.run(12)
+    show(plane(universe, 40, 26), 'step 12 — two copies')
+    universe.run(12)
+    show(plane(universe, 40, 26),
+         'step 24 — still two: the inner copies met and cancelled')
+    universe.run(12)
+    show(plane(universe, 40, 26), 'step 36 — four copies')
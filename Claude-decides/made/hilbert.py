@@ -22,6 +22,10 @@ Shown here at orders 1 through 4.
 The path color shows progress: · (start) through █ (end).
 """
 
+import numpy as np  # pip install numpy
+
+from raster import draw
+
 W, H = 65, 31      # display grid
 ORDERS = [1, 2, 3, 4]
 
@@ -45,17 +49,6 @@ def d2xy(n, d):
     return x, y
 
 
-def draw_line_on_grid(grid, c1, r1, c2, r2, char):
-    steps = max(abs(c2-c1), abs(r2-r1), 1) * 3
-    for i in range(steps + 1):
-        t = i / steps
-        col = int(round(c1 + t * (c2 - c1)))
-        row = int(round(r1 + t * (r2 - r1)))
-        if 0 <= col < W and 0 <= row < H:
-            if grid[row][col] == ' ':
-                grid[row][col] = char
-
-
 def render_order(order):
     grid = [[' '] * W for _ in range(H)]
     n = 2 ** order
@@ -63,21 +56,24 @@ def render_order(order):
 
     CHARS = '·░▒▓█'
 
-    prev_col = prev_row = None
+    points = []
     for d in range(total):
         x, y = d2xy(n, d)
         col = int(x * (W - 1) / (n - 1)) if n > 1 else W // 2
         row = int((1.0 - y / (n - 1)) * (H - 1)) if n > 1 else H // 2
-
-        progress = d / (total - 1)
-        char = CHARS[int(progress * (len(CHARS) - 1))]
-
-        if prev_col is not None:
-            draw_line_on_grid(grid, prev_col, prev_row, col, row, char)
-        if 0 <= col < W and 0 <= row < H:
-            grid[row][col] = char
-
-        prev_col, prev_row = col, row
+        points.append((col, row))
+    points = np.array(points)
+
+    # Each step's line fills only blank cells; the points themselves
+    # are stamped on top, later ones over earlier.
+    steps = draw(np.hstack([points[:-1], points[1:]]), W, H,
+                 oversample=3, first=True)
+    stamps = draw(np.hstack([points, points]), W, H)
+    d = np.where(stamps >= 0, stamps, np.where(steps >= 0, steps + 1, -1))
+
+    for row, col in zip(*np.nonzero(d >= 0)):
+        progress = d[row, col] / (total - 1)
+        grid[row][col] = CHARS[int(progress * (len(CHARS) - 1))]
 
     return grid
 
@@ -14,38 +14,166 @@ Three very different Julia sets below:
   c = -0.7 + 0.27i     — a connected, spiral-rich set
   c = -0.4 + 0.6i      — another connected form; looks like a sea horse
   c = 0.285 + 0.01i    — a beautiful connected set near the Mandelbrot boundary
+
+The iteration is the same one mandelbrot.py runs, with the roles of
+z₀ and c swapped; both use the array engine in escape_time.py.
+
+For animations, julia_sweep() takes a whole path of c values and
+iterates many frames at once as one (frames, h, w) block, a few frames
+at a time so memory stays bounded; save_sweep() writes them straight
+into a .npy file as they finish.
+
+The escape-time picture classifies every pixel, though the Julia set is
+only the boundary. julia_boundary() draws the boundary directly, running
+the map backwards: z → ±√(z − c) pulls points onto J(c) instead of away
+from it. Starting from the repelling fixed point, which lies on J(c),
+each step doubles the points; a pixel that has already been visited
+often enough stops sprouting new ones (the modified inverse iteration
+method), so the work goes where the boundary is thin, not where the
+picture is large.
 """
 
+import numpy as np  # pip install numpy
+
+from escape_time import (escape_counts, escape_distances, plane,
+                         subdivided_counts)
+
 W, H = 75, 38
 DENSITY = '·:+%█'  # characters from light to dark, by iteration count
 MAX_ITER = 80
+MAX_HITS = 12  # inverse iteration: visits before a pixel stops branching
+SWEEP_POINTS = 2 ** 22  # points iterated together in a sweep, all frames
 
 
 def julia_point(z0, c, max_iter):
-    z = z0
-    for i in range(max_iter):
-        if abs(z) > 2.0:
-            return i
-        z = z * z + c
-    return max_iter
-
-
-def render_julia(c, x_min, x_max, y_min, y_max, w=W, h=H):
-    rows = []
-    for row in range(h):
-        y = y_max - (y_max - y_min) * row / (h - 1)
-        line = ''
-        for col in range(w):
-            x = x_min + (x_max - x_min) * col / (w - 1)
-            z0 = complex(x, y)
-            iters = julia_point(z0, c, MAX_ITER)
-            if iters == MAX_ITER:
-                line += '█'
-            else:
-                idx = int(iters / MAX_ITER * (len(DENSITY) - 1))
-                line += DENSITY[idx]
-        rows.append(line)
-    return rows
+    """Escape count from z0 — a single point or a whole array of them."""
+    return escape_counts(z0, c, max_iter)
+
+
+def julia_counts(c, x_min, x_max, y_min, y_max, w=W, h=H, subdivide=False,
+                 stats=None):
+    """Iteration counts for J(c) over a w × h window.
+
+    With subdivide, rectangles with a uniform border are filled without
+    computing their insides; stats (a dict) then gets the fraction skipped.
+    """
+    z0 = plane(x_min, x_max, y_min, y_max, w, h)
+    if subdivide:
+        return subdivided_counts(z0, c, MAX_ITER, stats=stats)
+    return escape_counts(z0, c, MAX_ITER, stats=stats)
+
+
+def julia_sweep(cs, x_min, x_max, y_min, y_max, w=W, h=H, max_iter=MAX_ITER,
+                max_points=SWEEP_POINTS):
+    """Yield (first, counts) for a sequence of c values on one pixel grid.
+
+    counts is a (k, h, w) block for frames first .. first + k - 1, with k
+    chosen so each block holds about max_points pixels.
+    """
+    cs = np.asarray(cs, dtype=complex)
+    z0 = plane(x_min, x_max, y_min, y_max, w, h)
+    step = max(1, max_points // z0.size)
+    for first in range(0, cs.size, step):
+        c = cs[first:first + step, np.newaxis, np.newaxis]
+        yield first, escape_counts(z0, c, max_iter)
+
+
+def julia_cube(cs, x_min, x_max, y_min, y_max, w=W, h=H, max_iter=MAX_ITER):
+    """Iteration counts for every c at once, shape (len(cs), h, w)."""
+    return np.concatenate([block for _, block in
+                           julia_sweep(cs, x_min, x_max, y_min, y_max,
+                                       w, h, max_iter)])
+
+
+def save_sweep(path, cs, x_min, x_max, y_min, y_max, w=W, h=H,
+               max_iter=MAX_ITER):
+    """Write the (len(cs), h, w) cube to a .npy file, block by block."""
+    cs = np.asarray(cs, dtype=complex)
+    out = np.lib.format.open_memmap(path, mode='w+', dtype=np.int32,
+                                    shape=(cs.size, h, w))
+    for first, block in julia_sweep(cs, x_min, x_max, y_min, y_max,
+                                    w, h, max_iter):
+        out[first:first + len(block)] = block
+        out.flush()
+    return out
+
+
+def julia_filament_counts(c, x_min, x_max, y_min, y_max, w=W, h=H,
+                          max_iter=MAX_ITER):
+    """Iteration counts for J(c), with pixels in the filled Julia set or
+    within a pixel of it, by the distance estimate, counted as max_iter.
+    Counts and distances come from the same pass."""
+    z0 = plane(x_min, x_max, y_min, y_max, w, h)
+    n, dist = escape_distances(z0, c, max_iter, wrt='z')
+    pixel = max((x_max - x_min) / (w - 1), (y_max - y_min) / (h - 1))
+    return np.where(dist < pixel, max_iter, n)
+
+
+def julia_near_set(c, x_min, x_max, y_min, y_max, w=W, h=H,
+                   max_iter=MAX_ITER):
+    """True for pixels in the filled Julia set or within a pixel of it."""
+    return julia_filament_counts(c, x_min, x_max, y_min, y_max, w, h,
+                                 max_iter) == max_iter
+
+
+def shade(iters):
+    """Turn an array of iteration counts into lines of DENSITY."""
+    chars = np.array(list(DENSITY))
+    idx = iters * (len(DENSITY) - 1) // MAX_ITER
+    return [''.join(line) for line in chars[idx]]
+
+
+def julia_boundary(c, x_min, x_max, y_min, y_max, w=W, h=H,
+                   max_hits=MAX_HITS, max_depth=200, stats=None):
+    """Visit counts of backward orbits on a w × h window — J(c) itself.
+
+    The window should contain the whole set: points that leave it are
+    dropped. If stats is a dict it receives the number of points visited.
+    """
+    hits = np.zeros(h * w, dtype=np.int32)
+    z = np.array([(1 + np.sqrt(complex(1 - 4 * c))) / 2])
+    visited = 0
+    for _ in range(max_depth):
+        col = np.rint((z.real - x_min) / (x_max - x_min) * (w - 1))
+        row = np.rint((y_max - z.imag) / (y_max - y_min) * (h - 1))
+        inside = (col >= 0) & (col < w) & (row >= 0) & (row < h)
+        z = z[inside]
+        pixel = (row[inside] * w + col[inside]).astype(np.intp)
+        fresh = hits[pixel] < max_hits
+        z, pixel = z[fresh], pixel[fresh]
+        if z.size == 0:
+            break
+        visited += z.size
+        np.add.at(hits, pixel, 1)
+        root = np.sqrt(z - c)
+        z = np.concatenate([root, -root])
+    if stats is not None:
+        stats['points'] = visited
+    return hits.reshape(h, w)
+
+
+def shade_boundary(hits, max_hits=MAX_HITS):
+    """Lines of DENSITY by visit count, blank where nothing landed."""
+    chars = np.array([' '] + list(DENSITY))
+    idx = np.minimum((hits * len(DENSITY) + max_hits - 1) // max_hits,
+                     len(DENSITY))
+    return [''.join(line) for line in chars[idx]]
+
+
+def render_boundary(c, x_min, x_max, y_min, y_max, w=W, h=H,
+                    max_hits=MAX_HITS):
+    return shade_boundary(julia_boundary(c, x_min, x_max, y_min, y_max,
+                                         w, h, max_hits), max_hits)
+
+
+def render_julia(c, x_min, x_max, y_min, y_max, w=W, h=H, subdivide=False,
+                 stats=None, filaments=False):
+    if filaments:
+        # Every pixel needs its distance, so subdivide doesn't apply
+        return shade(julia_filament_counts(c, x_min, x_max, y_min, y_max,
+                                           w, h))
+    return shade(julia_counts(c, x_min, x_max, y_min, y_max, w, h,
+                              subdivide, stats))
 
 
 if __name__ == '__main__':
@@ -34,8 +34,23 @@ NOTABLE ONE-OFFS
 
 Each pattern tells a different story about emergence.
 The simple rules allow infinite variety.
+
+Run `python life_patterns.py hashlife` to follow the one-offs to their
+ends, and the glider gun to generation 10¹², on the unbounded plane
+(hashlife.py). `python life_patterns.py sparse` steps them generation
+by generation instead, touching only the tiles where something changes
+(sparselife.py).
 """
 
+import sys
+import time
+
+import numpy as np  # pip install numpy
+
+import lifelike
+from hashlife import HashLife
+from sparselife import SparseLife
+
 WIDTH = 80
 HEIGHT = 24
 
@@ -53,21 +68,7 @@ def place(grid, cells, ox=0, oy=0):
 
 
 def step_life(grid):
-    h = len(grid)
-    w = len(grid[0])
-    new = [[0] * w for _ in range(h)]
-    for r in range(h):
-        for c in range(w):
-            neighbors = sum(
-                grid[(r + dr) % h][(c + dc) % w]
-                for dr in [-1, 0, 1] for dc in [-1, 0, 1]
-                if (dr, dc) != (0, 0)
-            )
-            if grid[r][c]:
-                new[r][c] = 1 if neighbors in (2, 3) else 0
-            else:
-                new[r][c] = 1 if neighbors == 3 else 0
-    return new
+    return lifelike.step(np.array(grid), 'B3/S23').astype(int).tolist()
 
 
 def count(grid):
@@ -167,6 +168,55 @@ def demo_pattern(pattern, name, steps_to_show):
         print()
 
 
+def far_future():
+    """The long runs, by HashLife, with timings and cache statistics."""
+    print('Conway\'s Life — the far future (HashLife, unbounded plane)\n')
+    runs = [(R_PENTOMINO, 'R-pentomino', 1103),
+            (DIEHARD, 'Diehard', 130),
+            (ACORN, 'Acorn', 5206),
+            (GOSPER_GUN, 'Gosper Gun', 10 ** 12)]
+    for pattern, name, gens in runs:
+        universe = HashLife(pattern)
+        start = time.perf_counter()
+        universe.advance(gens)
+        ms = (time.perf_counter() - start) * 1000
+        s = universe.stats()
+        print(f'  {name:<12} gen {gens:>17,}   cells {universe.population:>17,}'
+              f'   {ms:8.1f} ms')
+        print(f'  {"":<12} {s["nodes"]:,} nodes, {s["hit_rate"]:.0%} of steps '
+              f'remembered, ~{s["bytes"] / 2**20:.1f} MB')
+    print()
+
+    grid = universe.window(-4, -4, HEIGHT, WIDTH).tolist()
+    print(f'  The gun at generation 10¹², still firing '
+          f'({universe.population:,} cells in all):')
+    print('  ┌' + '─' * WIDTH + '┐')
+    for row in grid:
+        print('  │' + ''.join('█' if c else ' ' for c in row) + '│')
+    print('  └' + '─' * WIDTH + '┘')
+
+
+def sparse_runs():
+    """The long runs one generation at a time, on the unbounded plane."""
+    print('Conway\'s Life — long runs on the unbounded plane (sparse tiles)\n')
+    runs = [(R_PENTOMINO, 'R-pentomino', 1103),
+            (ACORN, 'Acorn', 5206),
+            (GOSPER_GUN, 'Gosper Gun', 3000)]
+    for pattern, name, gens in runs:
+        universe = SparseLife(pattern)
+        start = time.perf_counter()
+        universe.run(gens)
+        seconds = time.perf_counter() - start
+        row0, row1, col0, col1 = universe.bounds()
+        print(f'  {name:<12} gen {gens:>5}   cells {universe.population:>5}'
+              f'   {seconds:6.2f} s   {len(universe.tiles):>3} tiles now, '
+              f'{universe.stepped / gens:6.1f} stepped per generation')
+        print(f'  {"":<12} spread over {row1 - row0 + 1} × {col1 - col0 + 1} cells')
+    print()
+    print('  On a torus the gun\'s gliders would wrap around and wreck it;')
+    print('  here they fly off forever, and the tiles follow them.')
+
+
 def main():
     print('Conway\'s Life — A Field Guide to Patterns\n')
     print('  The same rules. Different initial conditions. Different forever-afters.')
@@ -235,4 +285,9 @@ def main():
 
 
 if __name__ == '__main__':
-    main()
+    if sys.argv[1:] == ['hashlife']:
+        far_future()
+    elif sys.argv[1:] == ['sparse']:
+        sparse_runs()
+    else:
+        main()
@@ -23,27 +23,203 @@ It is a universal constant of chaos.
 
 The bifurcation diagram below plots the steady-state values of x
 (vertical axis) against r (horizontal axis, 2.5 to 4.0).
+
+Every column is iterated at once, as one array of r values, and the
+visits are counted rather than just marked — so the diagram can show
+where the orbit spends its time, not only where it goes. Any window of
+r and x can be drawn, with several r values per column, which is what
+it takes to look closely at the Feigenbaum point. Run with `zoom`.
+
+Chaos can also be measured directly. The Lyapunov exponent
+λ = average of ln|r·(1 − 2x)| along the orbit is the rate at which
+nearby starting points separate: negative where the orbit settles,
+positive where it is chaotic. Let r alternate between two values a and
+b in a fixed pattern — "AB", "AABAB" — and the sign of λ over the
+(a, b) plane draws a Markus–Lyapunov fractal. Run with `lyapunov`.
+
+And δ itself can be measured. At the superstable parameter r_n, x = 0.5
+lies on the 2ⁿ-cycle: 2ⁿ steps bring it back exactly. Newton's method
+finds each r_n, carrying dx/dr along the orbit, started from where the
+earlier r_n say the next one should be; the ratios of their spacings
+converge to δ. The arithmetic is fixed point on Python integers, because
+the spacings soon shrink below what float64 can tell apart. Run with
+`feigenbaum` to see δ to ten digits, and how long bisection would take.
 """
 
+import sys
+import time
+
+import numpy as np  # pip install numpy
+
 W, H = 120, 52
 R_MIN, R_MAX = 2.5, 4.0
 N_SKIP, N_PLOT = 500, 300
 
+# The accumulation point of the period-doubling cascade
+R_INFINITY = 3.5699456718695445
+
+SHADES = ' ·:+%█'
+
+LYAPUNOV_CHUNK = 2 ** 18   # points iterated together
+
+# Superstable parameters are held as integers scaled by 2**FIX_BITS
+FIX_BITS = 128
+FIX_ONE = 1 << FIX_BITS
+FEIGENBAUM_DELTA = 4.669201609102990
+
+
+def bifurcation_density(w=W, h=H, r_min=R_MIN, r_max=R_MAX, x_min=0.0,
+                        x_max=1.0, n_skip=N_SKIP, n_plot=N_PLOT,
+                        supersample=1):
+    """Visits per cell of the (x, r) window, as an (h, w) array.
+
+    Column i is centred on r_min + (r_max - r_min)·i/(w - 1) and spread
+    over `supersample` values of r across the column's width.
+    """
+    offsets = (np.arange(supersample) + 0.5) / supersample - 0.5
+    cols = np.repeat(np.arange(w), supersample)
+    r = r_min + (r_max - r_min) * (cols + np.tile(offsets, w)) / (w - 1)
+    x = np.full(r.size, 0.5)
+    for _ in range(n_skip):
+        x = r * x * (1 - x)
+
+    hist = np.zeros(h * w, dtype=np.int64)
+    for _ in range(n_plot):
+        x = r * x * (1 - x)
+        row = np.floor((x_max - x) / (x_max - x_min) * (h - 1) + 0.5)
+        seen = (row >= 0) & (row < h)
+        hist += np.bincount((row[seen] * w + cols[seen]).astype(np.intp),
+                            minlength=h * w)
+    return hist.reshape(h, w)
+
+
+def shade_density(hist):
+    """Lines of SHADES, by log of the visit count."""
+    level = np.log1p(hist) / np.log1p(max(hist.max(), 1))
+    idx = np.ceil(level * (len(SHADES) - 1)).astype(int)
+    return [''.join(SHADES[i] for i in row) for row in idx]
+
+
+def lyapunov_map(a, b, sequence='AB', n_skip=200, n_sum=1000, x0=0.4,
+                 chunk=LYAPUNOV_CHUNK):
+    """Lyapunov exponent of x → r·x·(1-x) with r following `sequence`,
+    reading A as a and B as b, for every (a, b) pair (arrays broadcast).
+    Computed `chunk` points at a time so memory stays bounded.
+
+    x0 is not 0.5: at r = 4 that lands exactly on the fixed point at 0.
+    """
+    a, b = np.broadcast_arrays(np.asarray(a, dtype=float),
+                               np.asarray(b, dtype=float))
+    flat_a, flat_b = a.ravel(), b.ravel()
+    out = np.empty(flat_a.size)
+    for start in range(0, out.size, chunk):
+        ra, rb = flat_a[start:start + chunk], flat_b[start:start + chunk]
+        rs = [ra if ch == 'A' else rb for ch in sequence]
+        x = np.full(ra.size, x0)
+        for n in range(n_skip):
+            x = rs[n % len(rs)] * x * (1 - x)
+        total = np.zeros(ra.size)
+        with np.errstate(divide='ignore'):
+            for n in range(n_sum):
+                r = rs[(n_skip + n) % len(rs)]
+                total += np.log(np.abs(r * (1 - 2 * x)))
+                x = r * x * (1 - x)
+        out[start:start + chunk] = total / n_sum
+    return out.reshape(a.shape)
+
+
+def lyapunov(r, n_skip=200, n_sum=1000):
+    """Lyapunov exponent of the plain logistic map, for each r."""
+    return lyapunov_map(r, r, 'A', n_skip, n_sum)
+
+
+def shade_lyapunov(lam):
+    """Lines for a Lyapunov map: order in SHADES, darker the more
+    stable; chaos (λ ≥ 0) left blank."""
+    depth = np.clip(-lam / 2, 0, 1)
+    idx = np.where(lam < 0, np.ceil(depth * (len(SHADES) - 1)), 0)
+    idx = np.maximum(idx, lam < 0).astype(int)
+    return [''.join(SHADES[i] for i in row) for row in idx]
+
+
+def return_miss(n, r):
+    """f_r applied 2ⁿ times to 0.5, minus 0.5, and its derivative in r.
+    Everything in fixed point."""
+    x, dx = FIX_ONE >> 1, 0
+    for _ in range(1 << n):
+        t = (x * (FIX_ONE - x)) >> FIX_BITS
+        dx = t + ((((r * (FIX_ONE - 2 * x)) >> FIX_BITS) * dx) >> FIX_BITS)
+        x = (r * t) >> FIX_BITS
+    return x - (FIX_ONE >> 1), dx
+
+
+def superstable_newton(n, r, tol=1 << 24, max_steps=50):
+    """Refine a guess at r_n (fixed point) by Newton's method.
+
+    Convergence is quadratic, so a few steps do from a good guess; a
+    guess that needs more than max_steps, or lands where the miss is
+    flat, raises ArithmeticError rather than wandering off.
+    """
+    for _ in range(max_steps):
+        miss, slope = return_miss(n, r)
+        if slope == 0:
+            raise ArithmeticError(f'Newton for r_{n}: zero slope at '
+                                  f'r = {r / FIX_ONE:.15f}')
+        step = (miss << FIX_BITS) // slope
+        r -= step
+        if abs(step) < tol:
+            return r
+    raise ArithmeticError(f'Newton for r_{n} did not converge in '
+                          f'{max_steps} steps (last r = {r / FIX_ONE:.15f})')
+
+
+def superstable_bisect(n, lo, hi, tol=1 << 24):
+    """Find r_n in [lo, hi] by bisection — the slow way, for comparison."""
+    lo_sign = return_miss(n, lo)[0] > 0
+    while hi - lo > tol:
+        mid = (lo + hi) // 2
+        if (return_miss(n, mid)[0] > 0) == lo_sign:
+            lo = mid
+        else:
+            hi = mid
+    return (lo + hi) // 2
+
+
+def superstable_parameters(n_max, method='newton'):
+    """r_0 .. r_n_max in fixed point.
+
+    Newton starts each r_n where the previous two and the latest δ_n put
+    it. Bisection gets a bracket from a tenth to a quarter of the last
+    spacing beyond r_{n-1}, which holds r_n and no other root.
+    """
+    rs = [2 * FIX_ONE]
+    rs.append(superstable_newton(1, int(3.2 * FIX_ONE)))
+    delta = 4.7  # a rough guess is enough to place r_2
+    for n in range(2, n_max + 1):
+        spacing = rs[-1] - rs[-2]
+        if method == 'newton':
+            r = superstable_newton(n, rs[-1] + int(spacing / delta))
+        else:
+            r = superstable_bisect(n, rs[-1] + spacing // 10,
+                                   rs[-1] + spacing // 4)
+        rs.append(r)
+        delta = (rs[-2] - rs[-3]) / (rs[-1] - rs[-2])
+    return rs
+
+
+def feigenbaum_estimates(rs):
+    """δ_n from successive spacings, and Aitken's Δ² extrapolation of them."""
+    deltas = [(a - b) / (b - c) for c, b, a in zip(rs[2:], rs[1:], rs)]
+    aitken = [d2 - (d2 - d1) ** 2 / ((d2 - d1) - (d1 - d0))
+              for d0, d1, d2 in zip(deltas, deltas[1:], deltas[2:])]
+    return deltas, aitken
+
 
 def bifurcation_diagram(w=W, h=H, r_min=R_MIN, r_max=R_MAX,
                         n_skip=N_SKIP, n_plot=N_PLOT):
-    grid = [[' '] * w for _ in range(h)]
-    for i in range(w):
-        r = r_min + (r_max - r_min) * i / (w - 1)
-        x = 0.5
-        for _ in range(n_skip):
-            x = r * x * (1 - x)
-        for _ in range(n_plot):
-            x = r * x * (1 - x)
-            row = int((1.0 - x) * (h - 1) + 0.5)
-            row = max(0, min(h - 1, row))
-            grid[row][i] = '█'
-    return grid
+    hist = bifurcation_density(w, h, r_min, r_max, n_skip=n_skip,
+                               n_plot=n_plot)
+    return [['█' if n else ' ' for n in row] for row in hist]
 
 
 def label_bar(r_min, r_max, width):
@@ -59,7 +235,65 @@ def label_bar(r_min, r_max, width):
     return ''.join(bar), labels
 
 
+def zoom():
+    print(f"Near the Feigenbaum point r∞ ≈ {R_INFINITY}")
+    print("r from 3.566 to 3.572, x from 0.45 to 0.56, 16 values of r per column\n")
+    hist = bifurcation_density(r_min=3.566, r_max=3.572, x_min=0.45,
+                               x_max=0.56, n_skip=20000, n_plot=4000,
+                               supersample=16)
+    for line in shade_density(hist):
+        print('  ' + line)
+
+
+def markus_lyapunov():
+    w, h = W, 48
+    a = np.linspace(2.0, 4.0, w)[np.newaxis, :]
+    b = np.linspace(4.0, 2.0, h)[:, np.newaxis]
+    lam = lyapunov(np.linspace(R_MIN, R_MAX, W))
+    print("Lyapunov exponent of the logistic map, r from 2.5 to 4.0")
+    print("(λ < 0 shaded — the orbit settles; blank where λ ≥ 0 — chaos)\n")
+    print('  ' + shade_lyapunov(lam[np.newaxis, :])[0])
+    for sequence in ('AB', 'AABAB'):
+        print(f"\nMarkus–Lyapunov fractal, sequence {sequence}: "
+              f"a from 2 to 4 across, b from 4 to 2 down\n")
+        for line in shade_lyapunov(lyapunov_map(a, b, sequence)):
+            print('  ' + line)
+
+
+def feigenbaum(n_max=15, n_bench=10):
+    start = time.perf_counter()
+    rs = superstable_parameters(n_max)
+    elapsed = time.perf_counter() - start
+    deltas, aitken = feigenbaum_estimates(rs)
+    print("Superstable parameters r_n (x = 0.5 on the 2ⁿ-cycle) and δ_n:\n")
+    for n, r in enumerate(rs):
+        d = f'{deltas[n - 2]:.12f}' if n >= 2 else ''
+        print(f"  n={n:>2}  r_n = {r / FIX_ONE:.16f}  {d}")
+    print(f"\n  δ ≈ {aitken[-1]:.12f}  (Aitken-extrapolated; "
+          f"true {FEIGENBAUM_DELTA})")
+    print(f"  {n_max + 1} parameters in {elapsed:.3f} s by warm-started Newton")
+
+    timings = {}
+    for method in ('newton', 'bisect'):
+        start = time.perf_counter()
+        superstable_parameters(n_bench, method)
+        timings[method] = time.perf_counter() - start
+    print(f"\n  Up to n={n_bench}:  Newton {timings['newton']:.3f} s,  "
+          f"bisection {timings['bisect']:.3f} s  "
+          f"({timings['bisect'] / timings['newton']:.0f}× slower)")
+
+
 if __name__ == '__main__':
+    if sys.argv[1:] == ['feigenbaum']:
+        feigenbaum()
+        sys.exit()
+    if sys.argv[1:] == ['zoom']:
+        zoom()
+        sys.exit()
+    if sys.argv[1:] == ['lyapunov']:
+        markus_lyapunov()
+        sys.exit()
+
     print("The Logistic Map — x → r·x·(1-x)")
     print("Bifurcation diagram: each column shows the long-term values of x for that r.\n")
 
@@ -18,9 +18,35 @@ generated by processes equivalent to L-systems.
 Evolution discovered this algorithm.
 
 We're running the algorithm and watching what grows.
+
+The string is never written out. Each rewriting multiplies its length by
+four or five, so ten generations would be tens of millions of symbols.
+Instead the rules are walked depth-first, like reading a book by
+following every footnote as it comes: commands() yields one symbol at a
+time and remembers only which rule it is partway through at each depth.
+The turtle's segments are drawn a batch at a time as they are made (by
+raster.py), so nothing grows with the plant but the picture. It takes
+two walks — one to find how big the plant is, one to draw it to fit.
+
+The plant is also made of copies of itself. X grown for five more
+generations is the same drawing wherever it appears — only moved and
+turned. So instanced() draws each (symbol, generations left) once, as
+an array of segments in its own frame plus where it leaves the turtle,
+and builds every bigger piece by rotating and shifting those arrays
+into place. The work is then proportional to the drawing rather than
+to the number of ways of reaching it.
+
+Run `python lsystem.py 10` to grow ten generations, streaming, or
+`python lsystem.py 10 instanced` to build them from cached pieces.
 """
 
 import math
+import sys
+from itertools import islice
+
+import numpy as np  # pip install numpy
+
+from raster import draw
 
 # Classic fractal plant
 AXIOM = 'X'
@@ -39,18 +65,35 @@ def expand(axiom, rules, n):
     return s
 
 
-def trace(instructions, step=2.0):
-    """Convert L-system string to a set of (x,y) points."""
+def commands(axiom, rules, n):
+    """Yield the symbols of expand(axiom, rules, n) one at a time.
+
+    Memory is one partly read rule per generation, however long the
+    expanded string would be.
+    """
+    stack = [(iter(axiom), n)]
+    while stack:
+        symbols, depth = stack[-1]
+        for c in symbols:
+            if depth and c in rules:
+                stack.append((iter(rules[c]), depth - 1))
+                break
+            yield c
+        else:
+            stack.pop()
+
+
+def walk(instructions, step=2.0):
+    """Yield the (x0,y0,x1,y1) line segments the turtle draws."""
     x, y = 0.0, 0.0
     heading = math.pi / 2   # pointing up
     stack = []
-    segments = []           # list of (x0,y0,x1,y1) line segments
 
     for cmd in instructions:
         if cmd == 'F':
             nx = x + math.cos(heading) * step
             ny = y + math.sin(heading) * step
-            segments.append((x, y, nx, ny))
+            yield x, y, nx, ny
             x, y = nx, ny
         elif cmd == '+':
             heading += ANGLE
@@ -61,65 +104,147 @@ def trace(instructions, step=2.0):
         elif cmd == ']':
             x, y, heading = stack.pop()
 
-    return segments
-
-
-def bresenham(x0, y0, x1, y1):
-    """Yield integer (x,y) points on the line from (x0,y0) to (x1,y1)."""
-    x0, y0, x1, y1 = int(round(x0)), int(round(y0)), int(round(x1)), int(round(y1))
-    dx = abs(x1 - x0); dy = abs(y1 - y0)
-    sx = 1 if x0 < x1 else -1
-    sy = 1 if y0 < y1 else -1
-    err = dx - dy
-    while True:
-        yield x0, y0
-        if x0 == x1 and y0 == y1:
-            break
-        e2 = 2 * err
-        if e2 > -dy:
-            err -= dy; x0 += sx
-        if e2 < dx:
-            err += dx; y0 += sy
-
-
-def render(segments, width=100, height=60):
-    if not segments:
-        return []
 
-    # find bounds
-    xs = [v for seg in segments for v in (seg[0], seg[2])]
-    ys = [v for seg in segments for v in (seg[1], seg[3])]
-    min_x, max_x = min(xs), max(xs)
-    min_y, max_y = min(ys), max(ys)
+def trace(instructions, step=2.0):
+    """Convert L-system string to a list of line segments."""
+    return list(walk(instructions, step))
+
+
+def extent(segments):
+    """(min_x, max_x, min_y, max_y) over a stream of segments."""
+    min_x = min_y = math.inf
+    max_x = max_y = -math.inf
+    for x0, y0, x1, y1 in segments:
+        min_x = min(min_x, x0, x1); max_x = max(max_x, x0, x1)
+        min_y = min(min_y, y0, y1); max_y = max(max_y, y0, y1)
+    return min_x, max_x, min_y, max_y
+
+
+def place(segments, x, y, heading):
+    """Segments drawn facing +x from the origin, turned and moved."""
+    c, s = math.cos(heading), math.sin(heading)
+    out = np.empty_like(segments)
+    out[:, 0::2] = x + c * segments[:, 0::2] - s * segments[:, 1::2]
+    out[:, 1::2] = y + s * segments[:, 0::2] + c * segments[:, 1::2]
+    return out
+
+
+def instanced(axiom, rules, n, step=2.0, angle=ANGLE, stats=None):
+    """The segments of n generations as an (N, 4) array, built from
+    memoized pieces.
+
+    Each (symbol, depth) is drawn once, facing +x from the origin, and
+    kept with the turtle's net move (dx, dy, dheading) across it.
+    Brackets in each rule must balance. If stats is a dict it gets the
+    number of pieces drawn ('blocks') and reused ('hits').
+    """
+    cache = {}
+    hits = 0
+
+    def assemble(symbols, depth):
+        nonlocal hits
+        parts = []
+        x = y = heading = 0.0
+        stack = []
+        for c in symbols:
+            if c == '[':
+                stack.append((x, y, heading))
+            elif c == ']':
+                x, y, heading = stack.pop()
+            else:
+                if (c, depth) in cache:
+                    hits += 1
+                else:
+                    cache[c, depth] = block(c, depth)
+                segments, dx, dy, dh = cache[c, depth]
+                if len(segments):
+                    parts.append(place(segments, x, y, heading))
+                cos, sin = math.cos(heading), math.sin(heading)
+                x, y = x + cos * dx - sin * dy, y + sin * dx + cos * dy
+                heading += dh
+        if stack:
+            raise ValueError(f'unbalanced brackets in {symbols!r}')
+        segments = np.concatenate(parts) if parts else np.empty((0, 4))
+        return segments, x, y, heading
+
+    def block(c, depth):
+        if depth and c in rules:
+            return assemble(rules[c], depth - 1)
+        if c == 'F':
+            return np.array([[0.0, 0.0, step, 0.0]]), step, 0.0, 0.0
+        turn = {'+': angle, '-': -angle}.get(c, 0.0)
+        return np.empty((0, 4)), 0.0, 0.0, turn
+
+    segments = assemble(axiom, n)[0]
+    if stats is not None:
+        stats['blocks'] = len(cache)
+        stats['hits'] = hits
+    return place(segments, 0.0, 0.0, math.pi / 2)
+
+
+def batches(segments, size=1 << 16):
+    """Segments as a sequence of (≤ size, 4) arrays."""
+    if isinstance(segments, np.ndarray):
+        for start in range(0, len(segments), size):
+            yield segments[start:start + size]
+        return
+    segments = iter(segments)
+    while block := list(islice(segments, size)):
+        yield np.array(block)
+
+
+def render(segments, width=100, height=60, bounds=None):
+    """Draw segments into a width × height character grid.
+
+    Without bounds the segments are gathered up first to measure them;
+    with bounds (from extent()) they are drawn as they stream past.
+    """
+    if bounds is None:
+        segments = list(segments)
+        if not segments:
+            return []
+        bounds = extent(segments)
+    min_x, max_x, min_y, max_y = bounds
 
     # scale to fit, preserving aspect
     span_x = max_x - min_x or 1
     span_y = max_y - min_y or 1
     scale = min((width - 2) / span_x, (height - 2) / span_y)
 
-    grid = [[' '] * width for _ in range(height)]
+    lit = np.zeros((height, width), dtype=bool)
+    for block in batches(segments):
+        pixels = np.rint((block - [min_x, min_y, min_x, min_y]) * scale + 1)
+        pixels[:, 1::2] = height - 1 - pixels[:, 1::2]   # flip y
+        lit |= draw(pixels, width, height) >= 0
 
-    for x0, y0, x1, y1 in segments:
-        sx0 = (x0 - min_x) * scale + 1
-        sy0 = (y0 - min_y) * scale + 1
-        sx1 = (x1 - min_x) * scale + 1
-        sy1 = (y1 - min_y) * scale + 1
+    return [''.join('█' if on else ' ' for on in row) for row in lit]
 
-        for px, py in bresenham(sx0, sy0, sx1, sy1):
-            row = height - 1 - py   # flip y
-            if 0 <= row < height and 0 <= px < width:
-                grid[row][px] = '█'
 
-    return [''.join(row) for row in grid]
+def grow(n=ITERATIONS, width=100, height=60):
+    """Render n generations of the plant in two streaming passes."""
+    bounds = extent(walk(commands(AXIOM, RULES, n)))
+    if bounds[0] > bounds[1]:
+        return []
+    return render(walk(commands(AXIOM, RULES, n)), width, height, bounds)
 
 
 if __name__ == '__main__':
-    print(f"L-System Fractal Plant ({ITERATIONS} iterations)")
+    n = int(sys.argv[1]) if sys.argv[1:] else ITERATIONS
+    print(f"L-System Fractal Plant ({n} iterations)")
     print(f"Axiom: {AXIOM}")
     print(f"Rules: X→F+[[X]-X]-F[-FX]+X, F→FF")
     print(f"Angle: 25°\n")
 
-    instructions = expand(AXIOM, RULES, ITERATIONS)
-    segments = trace(instructions)
-    for line in render(segments):
+    if sys.argv[2:] == ['instanced']:
+        stats = {}
+        segments = instanced(AXIOM, RULES, n, stats=stats)
+        bounds = (segments[:, 0::2].min(), segments[:, 0::2].max(),
+                  segments[:, 1::2].min(), segments[:, 1::2].max())
+        lines = render(segments, bounds=bounds)
+    else:
+        lines = grow(n)
+    for line in lines:
         print(line)
+    if sys.argv[2:] == ['instanced']:
+        print(f"\n{len(segments):,} segments from {stats['blocks']} "
+              f"distinct pieces, reused {stats['hits']:,} times")
@@ -9,8 +9,56 @@ The boundary of the set is infinitely detailed — zoom in anywhere
 and there's more structure, forever. Self-similar but not identical.
 
 The whole thing emerges from z² + c.
+
+The iteration itself lives in escape_time.py, shared with julia.py,
+and runs over the whole viewport at once — so WIDTH and HEIGHT can be
+raised to poster size without waiting all day. Points inside the main
+cardioid and the period-2 bulb are recognised by formula, and orbits
+that fall into a cycle are stopped early, so the set itself — once the
+slowest part of the picture — costs almost nothing.
+
+Past a zoom of about 10⁻¹³ the viewport runs out of float64: neighbouring
+pixels round to the same c. deep_zoom() gets around this by perturbation.
+One reference orbit, at the centre, is computed in high precision with
+decimal. Every other pixel is tracked only as its small difference δ from
+that orbit, which float64 holds comfortably down to about 10⁻³⁰⁰:
+
+    δ → 2·Z·δ + δ² + δc
+
+When a pixel's orbit passes closer to 0 than its own δ — where the
+difference stops being small and the float64 arithmetic goes wrong
+(a "glitch") — it is rebased onto the start of the reference orbit
+and carries on. One expensive orbit, then cheap arithmetic for the rest.
+
+Run with `deep` as an argument to fall into Seahorse Valley.
+
+The Buddhabrot turns the picture inside out: instead of colouring c,
+it plots where the escaping orbits go. Most c escape at once and never
+cross the viewport, so sampling c uniformly wastes nearly every orbit.
+buddhabrot() samples by Metropolis–Hastings instead — many chains at
+once, each proposing a small jiggle of its c (or, sometimes, a fresh
+random one) and accepting with the ratio of orbit points that land in
+view. The chains stay where the picture is made. Each orbit is weighted
+by the inverse of that count, so the histogram is the same one uniform
+sampling would converge to. The chains start from a pool of uniform
+draws, picked in proportion to the same count, so they begin about
+where they would settle. Each orbit is iterated once, when it is
+proposed; a chain keeps the pixels its orbit landed on until it moves.
+Thousands of chains step together, so the work is in numpy, not in the
+loop. Worker processes keep their own histograms; they are summed at
+the end. Run with `buddha` to draw one.
 """
 
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from decimal import Decimal, localcontext
+
+import numpy as np  # pip install numpy
+
+from escape_time import (escape_counts, escape_distances, in_main_bulbs,
+                         plane, subdivided_counts)
+
 WIDTH = 120
 HEIGHT = 40
 MAX_ITER = 64
@@ -23,31 +71,326 @@ IM_MIN, IM_MAX = -1.2, 1.2
 # nearby points get dense chars, escapees get sparse ones
 CHARS = ' ·:;+=xX$&#█'
 
+# A point on the boundary in Seahorse Valley, known to plenty of digits
+SEAHORSE = ('-0.743643887037158704752191506114774',
+            '0.131825904205311970493132056385139')
+
+# Buddhabrot: where proposals come from, and how often they jump there
+SAMPLE_BOX = (-2.0, 2.0, -2.0, 2.0)
+P_LARGE = 0.2
+POOL = 4        # uniform useful orbits drawn per chain to start from
+
+
+def mandelbrot(c, stats=None):
+    """Escape count for c — a single point or a whole array of them."""
+    return escape_counts(0, c, MAX_ITER, interior=in_main_bulbs(c),
+                         stats=stats)
+
+
+def counts(width=WIDTH, height=HEIGHT, stats=None, subdivide=False):
+    """Iteration counts over the viewport, one row per line of output.
+
+    With subdivide, only rectangle borders are computed where they agree
+    (Mariani–Silver); stats then also gets the fraction skipped.
+    """
+    c = plane(RE_MIN, RE_MAX, IM_MIN, IM_MAX, width, height, endpoint=False)
+    if subdivide:
+        return subdivided_counts(0, c, MAX_ITER, interior=in_main_bulbs(c),
+                                 stats=stats)
+    return mandelbrot(c, stats)
+
+
+def filament_counts(width=WIDTH, height=HEIGHT, max_iter=MAX_ITER):
+    """Iteration counts over the viewport, with pixels in the set or
+    within a pixel width of it counted as max_iter.
+
+    Uses the distance estimate, so thin filaments stay connected even
+    at a modest max_iter. Counts and distances come from the same pass.
+    """
+    c = plane(RE_MIN, RE_MAX, IM_MIN, IM_MAX, width, height, endpoint=False)
+    n, dist = escape_distances(0, c, max_iter, interior=in_main_bulbs(c))
+    pixel = max((RE_MAX - RE_MIN) / width, (IM_MAX - IM_MIN) / height)
+    return np.where(dist < pixel, max_iter, n)
+
+
+def near_set(width=WIDTH, height=HEIGHT, max_iter=MAX_ITER):
+    """True for pixels in the set or within a pixel width of it."""
+    return filament_counts(width, height, max_iter) == max_iter
+
+
+def shade(n, max_iter=MAX_ITER, lo=0):
+    """Turn an array of iteration counts into lines of CHARS.
+
+    Counts from lo up to max_iter are spread evenly over the characters;
+    deep frames use shade_deep() instead.
+    """
+    chars = np.array(list(CHARS))
+    idx = (n - lo) * (len(CHARS) - 1) // max(max_iter - lo, 1)
+    return [''.join(line) for line in chars[idx]]
+
+
+def shade_deep(n, max_iter):
+    """Lines of CHARS for a deep frame, shaded by rank within the frame.
+
+    Deep in the boundary nearly every pixel escapes within a few
+    iterations of the slowest, and a handful take thousands more, so a
+    linear scale up to max_iter leaves the frame blank. Here each
+    escaped pixel is shaded by the share of escaped pixels that took no
+    longer than it did, up to the frame's slowest escape; only points
+    that never escaped get █.
+    """
+    escaped = n < max_iter
+    level = np.zeros(n.shape)
+    if escaped.any():
+        _, which = np.unique(n[escaped], return_inverse=True)
+        share = np.cumsum(np.bincount(which)) / escaped.sum()
+        level[escaped] = share[which]
+    top = len(CHARS) - 2
+    idx = np.where(escaped, np.minimum((level * (top + 1)).astype(int), top),
+                   len(CHARS) - 1)
+    chars = np.array(list(CHARS))
+    return [''.join(line) for line in chars[idx]]
+
+
+def render(stats=None, subdivide=False, filaments=False):
+    """Lines of the picture. With filaments, pixels within a pixel width
+    of the set are drawn as part of it; every pixel needs its distance
+    then, so subdivide is ignored."""
+    if filaments:
+        return shade(filament_counts())
+    return shade(counts(stats=stats, subdivide=subdivide))
+
+
+def reference_orbit(c_re, c_im, max_iter, digits):
+    """The orbit of 0 under z² + c, computed with `digits` significant
+    digits and rounded to float64 for storage. Stops once it escapes.
+
+    c_re and c_im may be strings, so no digits are lost on the way in.
+    """
+    with localcontext() as ctx:
+        ctx.prec = digits
+        cr, ci = Decimal(c_re), Decimal(c_im)
+        x = y = Decimal(0)
+        orbit = [0j]
+        for _ in range(max_iter):
+            x, y = x * x - y * y + cr, 2 * x * y + ci
+            orbit.append(complex(float(x), float(y)))
+            if x * x + y * y > 4:
+                break
+    return np.array(orbit)
+
+
+def perturbed_counts(orbit, dc, max_iter):
+    """Escape counts for reference + dc, iterating only the offsets.
+
+    Returns (counts, rebases). A pixel is rebased when |z| < |δ| — the
+    glitch condition — or when it outlives the reference orbit.
+    """
+    shape = dc.shape
+    dc = dc.ravel()
+    counts = np.full(dc.size, max_iter, dtype=np.int32)
+    active = np.arange(dc.size)
+    d = np.zeros_like(dc)
+    m = np.zeros(dc.size, dtype=np.intp)
+    last = len(orbit) - 1
+    rebases = 0
+
+    for i in range(max_iter):
+        z = orbit[m] + d
+        az = np.abs(z)
+        escaped = az > 2
+        if escaped.any():
+            counts[active[escaped]] = i
+            keep = ~escaped
+            active, d, dc, m = active[keep], d[keep], dc[keep], m[keep]
+            z, az = z[keep], az[keep]
+            if active.size == 0:
+                break
+
+        rebase = (az < np.abs(d)) | (m == last)
+        if rebase.any():
+            d[rebase] = z[rebase]
+            m[rebase] = 0
+            rebases += int(rebase.sum())
+
+        d = (2 * orbit[m] + d) * d + dc
+        m += 1
+
+    return counts.reshape(shape), rebases
+
+
+def deep_zoom(center_re, center_im, radius, width=WIDTH, height=HEIGHT,
+              max_iter=1000):
+    """Escape counts for a view `radius` tall (half-height) around a centre
+    given to arbitrary precision. Returns (counts, rebases).
+    """
+    for frame in zoom_frames(center_re, center_im, [radius],
+                             width, height, max_iter):
+        return frame[1:]
+
+
+def zoom_frames(center_re, center_im, radii, width=WIDTH, height=HEIGHT,
+                max_iter=1000):
+    """Yield (radius, counts, rebases) for each radius in turn.
+
+    One reference orbit, precise enough for the smallest radius,
+    serves every frame of the zoom.
+    """
+    radii = [Decimal(r) for r in radii]
+    digits = -min(radii).adjusted() + 20
+    orbit = reference_orbit(center_re, center_im, max_iter, digits)
+    aspect = (RE_MAX - RE_MIN) / (IM_MAX - IM_MIN)
+    unit = plane(-aspect, aspect, -1, 1, width, height, endpoint=False)
+    for r in radii:
+        n, rebases = perturbed_counts(orbit, unit * float(r), max_iter)
+        yield r, n, rebases
+
+
+def orbit_pixels(c, max_iter, width=WIDTH, height=HEIGHT):
+    """Where each escaping orbit of 0 under z² + c lands in the viewport.
+
+    An (n, max_iter) array of flat pixel indices (row·width + col), one
+    column per iteration: -1 where the orbit was out of view or already
+    gone, and all -1 for orbits that don't escape within max_iter.
+    """
+    c = np.asarray(c, dtype=complex).ravel()
+    pixels = np.full((c.size, max_iter), -1, dtype=np.int32)
+    escaped = np.zeros(c.size, dtype=bool)
+    active = np.arange(c.size)
+    z = np.zeros(c.size, dtype=complex)
+    c_active = c
+    for i in range(max_iter):
+        z = z * z + c_active
+        out = np.abs(z) > 2
+        if out.any():
+            escaped[active[out]] = True
+            keep = ~out
+            active, z, c_active = active[keep], z[keep], c_active[keep]
+            if active.size == 0:
+                break
+        col = np.floor((z.real - RE_MIN) / (RE_MAX - RE_MIN) * width)
+        row = np.floor((IM_MAX - z.imag) / (IM_MAX - IM_MIN) * height)
+        seen = (col >= 0) & (col < width) & (row >= 0) & (row < height)
+        pixels[active[seen], i] = row[seen] * width + col[seen]
+    pixels[~escaped] = -1
+    return pixels
+
+
+def orbit_hits(c, max_iter, width=WIDTH, height=HEIGHT):
+    """How many points of each escaping orbit of 0 under z² + c land in
+    the viewport; 0 for orbits that don't escape within max_iter."""
+    return (orbit_pixels(c, max_iter, width, height) >= 0).sum(axis=1)
+
+
+def buddhabrot_chains(seed, chains, steps, max_iter, width=WIDTH,
+                      height=HEIGHT, p_large=P_LARGE):
+    """Run `chains` Metropolis chains for `steps` steps, all at once.
+
+    Returns (histogram, stats). stats counts proposals ('samples') and
+    those whose orbit crossed the viewport ('useful'), overall and for
+    the uniformly drawn proposals alone.
+
+    Each orbit is iterated once, when it is proposed. A chain keeps the
+    pixels its current orbit landed on and adds them to the histogram,
+    weighted by how long it stayed, when it moves on.
+    """
+    rng = np.random.default_rng(seed)
+    x0, x1, y0, y1 = SAMPLE_BOX
+    scale = RE_MAX - RE_MIN
+    stats = dict(samples=0, useful=0, uniform_samples=0, uniform_useful=0)
+    hist = np.zeros(height * width)
+
+    def uniform(n):
+        return rng.uniform(x0, x1, n) + 1j * rng.uniform(y0, y1, n)
+
+    def evaluate(c, fresh):
+        pixels = orbit_pixels(c, max_iter, width, height)
+        f = (pixels >= 0).sum(axis=1)
+        stats['samples'] += c.size
+        stats['useful'] += int((f > 0).sum())
+        stats['uniform_samples'] += int(fresh.sum())
+        stats['uniform_useful'] += int((f[fresh] > 0).sum())
+        return pixels, f
+
+    def deposit(pixels, weights):
+        seen = pixels >= 0
+        hist[:] += np.bincount(
+            pixels[seen], np.broadcast_to(weights[:, np.newaxis],
+                                          pixels.shape)[seen],
+            minlength=hist.size)
+
+    # Start where the chains would settle: draw POOL useful orbits per
+    # chain uniformly, then pick among them in proportion to f
+    pool_c, pool_f, pool_landed = [], [], []
+    wanted = POOL * chains
+    while wanted > 0:
+        trial = uniform(chains)
+        pt, ft = evaluate(trial, np.ones(chains, dtype=bool))
+        found = ft > 0
+        pool_c.append(trial[found])
+        pool_f.append(ft[found])
+        pool_landed.append(pt[found])
+        wanted -= found.sum()
+    pool_f = np.concatenate(pool_f)
+    pick = rng.choice(pool_f.size, chains, p=pool_f / pool_f.sum())
+    c = np.concatenate(pool_c)[pick]
+    f = pool_f[pick].astype(float)
+    landed = np.concatenate(pool_landed)[pick]
 
-def mandelbrot(c):
-    z = 0
-    for i in range(MAX_ITER):
-        if abs(z) > 2:
-            return i
-        z = z * z + c
-    return MAX_ITER
+    stay = np.ones(chains)
+    for _ in range(steps):
+        large = rng.random(chains) < p_large
+        radius = scale * 10 ** rng.uniform(-4, -1, chains)
+        jiggle = c + radius * np.exp(2j * np.pi * rng.random(chains))
+        proposal = np.where(large, uniform(chains), jiggle)
+        pp, fp = evaluate(proposal, large)
+        accept = rng.random(chains) * f < fp
+        if accept.any():
+            deposit(landed[accept], stay[accept] / f[accept])
+            c[accept], f[accept], stay[accept] = proposal[accept], fp[accept], 0
+            landed[accept] = pp[accept]
+        stay += 1
+    deposit(landed, stay / f)
+    return hist.reshape(height, width), stats
 
 
-def render():
-    rows = []
-    for row in range(HEIGHT):
-        line = []
-        im = IM_MAX - (row / HEIGHT) * (IM_MAX - IM_MIN)
-        for col in range(WIDTH):
-            re = RE_MIN + (col / WIDTH) * (RE_MAX - RE_MIN)
-            c = complex(re, im)
-            n = mandelbrot(c)
-            idx = int((n / MAX_ITER) * (len(CHARS) - 1))
-            line.append(CHARS[idx])
-        rows.append(''.join(line))
-    return rows
+def buddhabrot(samples=1000000, max_iter=200, width=WIDTH, height=HEIGHT,
+               workers=None, chains=8192, seed=None):
+    """A Buddhabrot histogram from about `samples` proposals, split over
+    worker processes. Returns (histogram, stats) summed over workers."""
+    workers = workers or os.cpu_count()
+    steps = max(1, samples // (workers * chains))
+    seeds = np.random.SeedSequence(seed).spawn(workers)
+    with ProcessPoolExecutor(workers) as pool:
+        parts = list(pool.map(buddhabrot_chains, seeds, [chains] * workers,
+                              [steps] * workers, [max_iter] * workers,
+                              [width] * workers, [height] * workers))
+    hist = sum(h for h, _ in parts)
+    stats = {k: sum(s[k] for _, s in parts) for k in parts[0][1]}
+    return hist, stats
 
 
 if __name__ == '__main__':
-    for row in render():
-        print(row)
+    if sys.argv[1:] == ['deep']:
+        radii, max_iter = ['1e-10', '1e-20', '1e-30'], 50000
+        for r, n, rebases in zoom_frames(*SEAHORSE, radii, max_iter=max_iter):
+            print(f'radius {r}  ({rebases} rebases)')
+            for row in shade_deep(n, max_iter):
+                print(row)
+            print()
+    elif sys.argv[1:] == ['buddha']:
+        hist, stats = buddhabrot()
+        level = np.sqrt(hist / hist.max())
+        idx = (level * (len(CHARS) - 1)).astype(int)
+        for line in idx:
+            print(''.join(CHARS[i] for i in line))
+        print(f"\n{stats['samples'] / stats['useful']:.2f} samples per "
+              f"useful orbit (uniform sampling: "
+              f"{stats['uniform_samples'] / stats['uniform_useful']:.2f})")
+    else:
+        stats = {}
+        for row in render(stats):
+            print(row)
+        total = stats['iterations'] + stats['saved']
+        print(f"\n{stats['saved']} of {total} iterations skipped "
+              f"(interior shortcuts)")
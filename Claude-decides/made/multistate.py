@@ -0,0 +1,82 @@
+"""
+Cellular automata with more than two states, a whole grid at a time.
+
+Brian's Brain, Wireworld and the cyclic automaton all work the same
+way. Each state looks at its neighbours and counts how many are in one
+particular state — OFF cells count ON neighbours, copper counts electron
+heads, a cyclic cell counts the state that eats it — and the pair
+(my state, that count) decides what it becomes.
+
+So a rule is two small arrays. watch[s] is the state that cells in
+state s count. table[s, n] is the next state of a cell in state s with
+n such neighbours. States that always do the same thing (a HEAD always
+becomes a TAIL) just have the same entry for every count.
+
+step() does the counting for all cells together. When every state
+watches the same one, shift a grid of "is this that state" eight ways
+(or four) and add; otherwise shift the grid itself and compare each
+cell's neighbours with the state that cell watches. Either way it is a
+handful of whole-array operations, and one table lookup gives the whole
+next generation.
+
+The grid is a uint8 array; cells off the edge of a bounded grid are in
+no state at all.
+"""
+
+import numpy as np  # pip install numpy
+
+MOORE = [(dr, dc) for dr in (-1, 0, 1) for dc in (-1, 0, 1) if dr or dc]
+VON_NEUMANN = [(-1, 0), (1, 0), (0, -1), (0, 1)]
+NOWHERE = 255   # the state of cells off the edge of a bounded grid
+
+
+def rule(n_states, neighbourhood=MOORE):
+    """A do-nothing rule to fill in: (watch, table).
+
+    Every state watches state 0 and stays as it is, whatever the count.
+    """
+    watch = np.zeros(n_states, dtype=np.intp)
+    table = np.repeat(np.arange(n_states, dtype=np.uint8)[:, np.newaxis],
+                      len(neighbourhood) + 1, axis=1)
+    return watch, table
+
+
+def count(grid, state, neighbourhood=MOORE, torus=True):
+    """How many neighbours of each cell are in state, as uint8."""
+    cells = (np.asarray(grid) == state).view(np.uint8)
+    h, w = cells.shape
+    padded = np.pad(cells, 1, mode='wrap' if torus else 'constant')
+    out = np.zeros((h, w), dtype=np.uint8)
+    for dr, dc in neighbourhood:
+        out += padded[1 + dr:h + 1 + dr, 1 + dc:w + 1 + dc]
+    return out
+
+
+def step(grid, watch, table, neighbourhood=MOORE, torus=True):
+    """One generation: table[state, count of watch[state] neighbours]."""
+    grid = np.asarray(grid, dtype=np.uint8)
+    watch = np.asarray(watch, dtype=np.uint8)
+    h, w = grid.shape
+    if (watch == watch[0]).all():
+        n = count(grid, watch[0], neighbourhood, torus)
+    else:
+        # Every cell compares its neighbours with the state it watches;
+        # off the edge is NOWHERE, which no state watches
+        target = np.take(watch, grid)
+        if torus:
+            padded = np.pad(grid, 1, mode='wrap')
+        else:
+            padded = np.pad(grid, 1, constant_values=NOWHERE)
+        n = np.zeros((h, w), dtype=np.uint8)
+        for dr, dc in neighbourhood:
+            n += padded[1 + dr:h + 1 + dr, 1 + dc:w + 1 + dc] == target
+    # Flat index into the table: state * row length + count
+    index = grid * np.uint16(table.shape[1])
+    index += n
+    return np.take(table.ravel(), index)
+
+
+def run(grid, watch, table, generations, neighbourhood=MOORE, torus=True):
+    for _ in range(generations):
+        grid = step(grid, watch, table, neighbourhood, torus)
+    return grid
@@ -23,57 +23,96 @@ imperceptible differences. This is the signature of chaos.
 
 The stable regions are predictable. The boundary is not.
 Both are produced by the same four-character equation.
+
+Nothing here is special to z³ − 1. Any polynomial will do: its roots
+are the eigenvalues of its companion matrix, and Newton's method is
+run on every pixel at once, evaluating f and f' together by Horner's
+rule. A pixel whose step has shrunk below TOL has converged and leaves
+the computation; only then is it matched to its nearest root.
 """
 
-import math
+import numpy as np  # pip install numpy
 
 W, H = 80, 44
 X_MIN, X_MAX = -1.8, 1.8
 Y_MIN, Y_MAX = -1.2, 1.2
 MAX_ITER = 50
+TOL = 1e-5
 
-ROOTS = [
-    complex(1, 0),
-    complex(-0.5,  math.sqrt(3) / 2),
-    complex(-0.5, -math.sqrt(3) / 2),
-]
+# f(z) = z³ − 1, highest power first
+COEFFS = [1, 0, 0, -1]
 
 # Characters: root regions use distinct chars; slow convergence uses '+'
 CHARS = ['█', '░', '·']
 
 
-def newton_step(z):
-    z2 = z * z
-    denom = 3 * z2
-    if abs(denom) < 1e-14:
-        return None
-    return (2 * z2 * z + 1) / denom
+def polynomial_roots(coeffs):
+    """Roots of a polynomial (highest power first), from its companion
+    matrix, ordered by angle counterclockwise from the positive real axis."""
+    coeffs = np.asarray(coeffs, dtype=complex)
+    coeffs = coeffs / coeffs[0]
+    n = coeffs.size - 1
+    companion = np.zeros((n, n), dtype=complex)
+    companion[0, :] = -coeffs[1:]
+    companion[1:, :-1] = np.eye(n - 1)
+    roots = np.linalg.eigvals(companion)
+    angle = np.round(np.angle(roots), 9) % (2 * np.pi)
+    return roots[np.lexsort((np.abs(roots), angle))]
+
+
+ROOTS = polynomial_roots(COEFFS)
+
+
+def basins(coeffs, z0, max_iter=MAX_ITER, tol=TOL, roots=None):
+    """Newton's method on an array of starting points.
+
+    Returns (basin, iters): the index into roots of the root each point
+    converged to, or -1 if it didn't, and the steps it took.
+    """
+    coeffs = np.asarray(coeffs, dtype=complex)
+    if roots is None:
+        roots = polynomial_roots(coeffs)
+    z0 = np.asarray(z0, dtype=complex)
+    basin = np.full(z0.size, -1, dtype=np.int32)
+    iters = np.full(z0.size, max_iter, dtype=np.int32)
+    active = np.arange(z0.size)
+    z = z0.ravel().copy()
+
+    for i in range(max_iter):
+        f = np.full(z.size, coeffs[0])
+        df = np.zeros(z.size, dtype=complex)
+        for a in coeffs[1:]:
+            df = df * z + f
+            f = f * z + a
+        stuck = df == 0
+        step = f / np.where(stuck, 1, df)
+        converged = ~stuck & (np.abs(step) < tol)
+        if converged.any():
+            near = np.abs(z[converged, np.newaxis] - roots).argmin(axis=1)
+            basin[active[converged]] = near
+            iters[active[converged]] = i
+        done = converged | stuck
+        if done.any():
+            keep = ~done
+            active, z, step = active[keep], z[keep], step[keep]
+            if active.size == 0:
+                break
+        z -= step
+
+    return basin.reshape(z0.shape), iters.reshape(z0.shape)
 
 
 def classify(z0):
-    z = z0
-    for _ in range(MAX_ITER):
-        for i, root in enumerate(ROOTS):
-            if abs(z - root) < 1e-5:
-                return i
-        step = newton_step(z)
-        if step is None:
-            return -1
-        z = step
-    return -1
+    """Root index for z0 (a point or an array of them), -1 if none."""
+    return basins(COEFFS, z0, roots=ROOTS)[0]
 
 
 def render():
-    rows = []
-    for r in range(H):
-        y = Y_MAX - (Y_MAX - Y_MIN) * r / (H - 1)
-        row = ''
-        for c in range(W):
-            x = X_MIN + (X_MAX - X_MIN) * c / (W - 1)
-            idx = classify(complex(x, y))
-            row += CHARS[idx] if idx >= 0 else '+'
-        rows.append(row)
-    return rows
+    xs = np.linspace(X_MIN, X_MAX, W)
+    ys = np.linspace(Y_MAX, Y_MIN, H)
+    basin = classify(xs[np.newaxis, :] + 1j * ys[:, np.newaxis])
+    chars = np.array(CHARS + ['+'])
+    return [''.join(row) for row in chars[basin]]
 
 
 if __name__ == '__main__':
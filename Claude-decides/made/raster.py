@@ -0,0 +1,128 @@
+"""
+Lines, all at once.
+
+lsystem.py, koch.py, hilbert.py and wireframe_3d.py each drew their
+lines one pixel at a time, in four slightly different Python loops.
+A plant ten generations deep is a million and a half segments, and at a
+few microseconds a pixel that is most of a minute spent walking.
+
+Here every segment is walked together. A segment from (x0, y0) to
+(x1, y1) crosses max(|Δx|, |Δy|) columns or rows, so that many evenly
+spaced samples along it, rounded, land on one pixel per step with no
+gaps — the digital differential analyser. For all the segments at
+once that is a few array operations: repeat each segment's index by
+its sample count, work out each sample's t, interpolate, round.
+
+Two pixels hit by different segments need a rule. draw() keeps the
+first segment to reach each pixel, or the last, or — given a depth for
+each endpoint — the nearest, like a z-buffer. coverage() instead adds
+up how much line passes through each pixel, and with antialias splits
+each sample between the two pixels it falls between (Xiaolin Wu's
+lines), so a faint line and a dense tangle can be told apart.
+
+Coordinates are pixels: x is the column, y the row, row 0 at the top.
+Segments are an (N, 4) array of x0, y0, x1, y1.
+"""
+
+import numpy as np  # pip install numpy
+
+
+def samples(segments, oversample=1):
+    """Evenly spaced points along every segment: (x, y, index, t).
+
+    Each segment gets ceil(oversample · max(|Δx|, |Δy|)) + 1 samples,
+    ends included; index says which segment each sample belongs to and
+    t how far along it is.
+    """
+    seg = np.asarray(segments, dtype=float).reshape(-1, 4)
+    x0, y0, x1, y1 = seg.T
+    length = np.maximum(np.abs(x1 - x0), np.abs(y1 - y0))
+    n = np.ceil(oversample * length).astype(np.int64) + 1
+
+    index = np.repeat(np.arange(len(seg)), n)
+    first = np.cumsum(n) - n
+    t = (np.arange(n.sum()) - first[index]) / np.maximum(n - 1, 1)[index]
+    x = x0[index] + t * (x1 - x0)[index]
+    y = y0[index] + t * (y1 - y0)[index]
+    return x, y, index, t
+
+
+def pixels(segments, oversample=1):
+    """The samples of every segment rounded to pixels: (col, row, index, t).
+
+    Halves round back towards the segment's start, as Bresenham's
+    algorithm does, so lines between whole pixels come out the same.
+    """
+    seg = np.asarray(segments, dtype=float).reshape(-1, 4)
+    x, y, index, t = samples(seg, oversample)
+
+    def nearest(v, start):
+        tie = v - np.floor(v) == 0.5
+        back = np.where(v > start, np.floor(v), np.ceil(v))
+        return np.where(tie, back, np.rint(v))
+
+    return nearest(x, seg[index, 0]), nearest(y, seg[index, 1]), index, t
+
+
+def draw(segments, w, h, oversample=1, first=False, depth=None):
+    """A (h, w) array holding, for each pixel, the index of the segment
+    drawn there, or -1.
+
+    Where segments cross, the last one wins, or the first with
+    first=True. depth, an (N, 2) array of the depth at each endpoint,
+    makes the nearest (smallest) one win instead.
+    """
+    col, row, index, t = pixels(segments, oversample)
+    seen = (col >= 0) & (col < w) & (row >= 0) & (row < h)
+    pixel = (row[seen] * w + col[seen]).astype(np.intp)
+    index = index[seen]
+
+    if depth is not None:
+        z0, z1 = np.asarray(depth, dtype=float).reshape(-1, 2).T
+        key = (z0[index] + t[seen] * (z1 - z0)[index])
+    else:
+        key = index if first else -index
+    order = np.lexsort((key, pixel))
+    pixel, index = pixel[order], index[order]
+    lead = np.ones(pixel.size, dtype=bool)
+    lead[1:] = pixel[1:] != pixel[:-1]
+
+    canvas = np.full(h * w, -1, dtype=np.int64)
+    canvas[pixel[lead]] = index[lead]
+    return canvas.reshape(h, w)
+
+
+def coverage(segments, w, h, oversample=1, antialias=False, weights=None):
+    """A (h, w) float array of how much line passes through each pixel.
+
+    Every sample adds weight / oversample (weight 1 unless weights, one
+    per segment, are given) to the pixel it rounds to. With antialias
+    it is shared between the two pixels either side of the line instead,
+    in proportion to how close the line runs to each.
+    """
+    seg = np.asarray(segments, dtype=float).reshape(-1, 4)
+    if antialias:
+        x, y, index, _ = samples(seg, oversample)
+    else:
+        col, row, index, _ = pixels(seg, oversample)
+    amount = np.full(index.size, 1 / oversample)
+    if weights is not None:
+        amount *= np.asarray(weights, dtype=float)[index]
+
+    if antialias:
+        steep = (np.abs(seg[:, 3] - seg[:, 1])
+                 > np.abs(seg[:, 2] - seg[:, 0]))[index]
+        major = np.rint(np.where(steep, y, x))
+        minor = np.where(steep, x, y)
+        low = np.floor(minor)
+        frac = minor - low
+        major = np.concatenate([major, major])
+        minor = np.concatenate([low, low + 1])
+        steep = np.concatenate([steep, steep])
+        amount = np.concatenate([amount * (1 - frac), amount * frac])
+        col = np.where(steep, minor, major)
+        row = np.where(steep, major, minor)
+
+    seen = (col >= 0) & (col < w) & (row >= 0) & (row < h)
+    pixel = (row[seen] * w + col[seen]).astype(np.intp)
+    return np.bincount(pixel, amount[seen], minlength=h * w).reshape(h, w)
@@ -24,26 +24,21 @@ Everything is always just born.
 
 import random
 
+import numpy as np  # pip install numpy
+
+import lifelike
+
 DEAD, LIVE = 0, 1
 CH = {DEAD: '·', LIVE: '█'}
 
+RULE = 'B2/S'  # born on 2, never survives
+
 W, H = 75, 35
 
 
 def step(grid):
-    H_g, W_g = len(grid), len(grid[0])
-    new = [[DEAD] * W_g for _ in range(H_g)]
-    for r in range(H_g):
-        for c in range(W_g):
-            neighbors = sum(
-                grid[(r + dr) % H_g][(c + dc) % W_g]
-                for dr in (-1, 0, 1) for dc in (-1, 0, 1)
-                if (dr, dc) != (0, 0)
-            )
-            # Seeds: B2/S — born on 2, never survives
-            if grid[r][c] == DEAD and neighbors == 2:
-                new[r][c] = LIVE
-    return new
+    new = lifelike.step(np.array(grid), RULE)
+    return np.where(new, LIVE, DEAD).tolist()
 
 
 def blank():
@@ -0,0 +1,150 @@
+"""
+Life on an unbounded plane, computed only where something happens.
+
+A fixed grid pays for every cell every generation, though most of a
+Life pattern is empty space or still life, and a torus lets a glider
+gun shoot itself in the back. Here the plane has no edge and is cut
+into square tiles (TILE × TILE cells), kept in a dict by tile
+coordinates; a tile that is empty is simply not there.
+
+A cell can only change if something within one cell of it changed last
+generation. So only the tiles that changed are stepped again, along with
+those neighbours whose shared edge or corner saw a change; a tile of
+still lifes with quiet neighbours is skipped, however many cells it
+holds. The tiles to step are stacked into one array, each with a
+one-cell border copied from its neighbours, and stepped together. Tiles
+that come out empty are dropped, and tiles that a pattern grows into are
+created, so the dict follows the pattern wherever it goes.
+
+The cost is then proportional to how much is happening, not to how big
+the pattern has grown: the debris of an Acorn run is mostly still, and
+a glider costs the same anywhere.
+
+Positions are (row, col) with row growing downward, as everywhere else
+in this folder.
+"""
+
+import numpy as np  # pip install numpy
+
+import lifelike
+
+TILE = 32
+
+NEIGHBOURS = [(dy, dx) for dy in (-1, 0, 1) for dx in (-1, 0, 1)]
+
+
+class SparseLife:
+    """A Life-like automaton on the unbounded plane, stored in tiles.
+
+    birth and survive are the neighbour counts of the rule (B3/S23 by
+    default).
+    """
+
+    def __init__(self, cells=(), birth=(3,), survive=(2, 3), tile=TILE):
+        self.tile = tile
+        self.rule = lifelike.table((tuple(birth), tuple(survive)))
+        if self.rule[0, 0]:
+            raise ValueError('B0 rules would fill the infinite plane')
+        self.tiles = {}
+        self.generation = 0
+        self.stepped = 0        # tile-steps performed
+        self.awake = set()      # tiles that may change in the next step
+        for row, col in cells:
+            self.set(row, col)
+
+    def set(self, row, col, alive=True):
+        key = (row // self.tile, col // self.tile)
+        if key not in self.tiles:
+            self.tiles[key] = np.zeros((self.tile, self.tile), dtype=bool)
+        self.tiles[key][row % self.tile, col % self.tile] = alive
+        ty, tx = key
+        self.awake.update((ty + dy, tx + dx) for dy, dx in NEIGHBOURS)
+
+    def step(self):
+        """Advance one generation."""
+        t = self.tile
+        todo = list(self.awake)
+        if not todo:
+            self.generation += 1
+            return
+
+        # Each tile to step, with a border of its neighbours' edge cells.
+        # nb[i, k] indexes the k-th neighbour of todo[i] in the stack of
+        # tiles involved; missing tiles point at a blank one at the end.
+        near = {(ty + dy, tx + dx) for ty, tx in todo for dy, dx in NEIGHBOURS}
+        near = [key for key in near if key in self.tiles]
+        index = {key: i for i, key in enumerate(near)}
+        stack = np.stack([self.tiles[key] for key in near]
+                         + [np.zeros((t, t), dtype=bool)])
+        blank = len(near)
+        nb = np.array([[index.get((ty + dy, tx + dx), blank)
+                        for dy, dx in NEIGHBOURS] for ty, tx in todo])
+
+        padded = np.zeros((len(todo), t + 2, t + 2), dtype=np.uint8)
+        padded[:, 0, 0] = stack[nb[:, 0], -1, -1]
+        padded[:, 0, 1:-1] = stack[nb[:, 1], -1, :]
+        padded[:, 0, -1] = stack[nb[:, 2], -1, 0]
+        padded[:, 1:-1, 0] = stack[nb[:, 3], :, -1]
+        padded[:, 1:-1, 1:-1] = stack[nb[:, 4]]
+        padded[:, 1:-1, -1] = stack[nb[:, 5], :, 0]
+        padded[:, -1, 0] = stack[nb[:, 6], 0, -1]
+        padded[:, -1, 1:-1] = stack[nb[:, 7], 0, :]
+        padded[:, -1, -1] = stack[nb[:, 8], 0, 0]
+
+        counts = sum(padded[:, 1 + dy:t + 1 + dy, 1 + dx:t + 1 + dx]
+                     for dy, dx in NEIGHBOURS if dy or dx)
+        alive = padded[:, 1:t + 1, 1:t + 1]
+        new = self.rule[alive, counts]
+        self.stepped += len(todo)
+
+        # A change wakes the tile, and any neighbour across an edge or
+        # corner that it touched
+        diff = new != alive.astype(bool)
+        wakes = np.stack([diff[:, 0, 0], diff[:, 0, :].any(1), diff[:, 0, -1],
+                          diff[:, :, 0].any(1), diff.any((1, 2)),
+                          diff[:, :, -1].any(1),
+                          diff[:, -1, 0], diff[:, -1, :].any(1),
+                          diff[:, -1, -1]], axis=1)
+        occupied = new.any((1, 2))
+        awake = set()
+        for i in np.flatnonzero(wakes[:, 4]):
+            ty, tx = key = todo[i]
+            if occupied[i]:
+                self.tiles[key] = new[i]
+            else:
+                self.tiles.pop(key, None)
+            awake.update((ty + dy, tx + dx)
+                         for (dy, dx), w in zip(NEIGHBOURS, wakes[i]) if w)
+        self.awake = awake
+        self.generation += 1
+
+    def run(self, generations):
+        for _ in range(generations):
+            self.step()
+
+    @property
+    def population(self):
+        return int(sum(tile.sum() for tile in self.tiles.values()))
+
+    def bounds(self):
+        """(row_min, row_max, col_min, col_max) of the live cells, or None."""
+        cells = self.cells()
+        if len(cells) == 0:
+            return None
+        return (cells[:, 0].min(), cells[:, 0].max(),
+                cells[:, 1].min(), cells[:, 1].max())
+
+    def cells(self):
+        """An (n, 2) array of live (row, col) positions."""
+        parts = [np.argwhere(tile) + (ty * self.tile, tx * self.tile)
+                 for (ty, tx), tile in self.tiles.items()]
+        return np.concatenate(parts) if parts else np.empty((0, 2), int)
+
+    def window(self, row0, col0, h, w):
+        """The h × w boolean array of cells from (row0, col0)."""
+        out = np.zeros((h, w), dtype=bool)
+        cells = self.cells() - (row0, col0)
+        inside = ((cells[:, 0] >= 0) & (cells[:, 0] < h)
+                  & (cells[:, 1] >= 0) & (cells[:, 1] < w))
+        out[cells[inside, 0], cells[inside, 1]] = True
+        return out
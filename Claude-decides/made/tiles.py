@@ -0,0 +1,257 @@
+"""
+Fractal tiles — pan and zoom without recomputing.
+
+A map of the Mandelbrot set is a pyramid. At zoom 0 one tile covers the
+square [-2, 2] × [-2, 2]; each zoom level cuts every tile into four.
+A view is just a handful of tiles, and the view one step to the left
+shares most of them with this one.
+
+So nothing is rendered twice. A tile is named by everything that
+determines it — (fractal, c, zoom, x, y, max_iter) — and the name is
+hashed to a file. If the file exists, the tile has been computed before,
+by anyone. If not, it goes to a pool of worker processes, and the
+result is written down for next time. When the cache outgrows its
+budget, the tiles nobody has looked at for longest are thrown away.
+
+Run this to build a view, pan it, and see how much was reused.
+Run `python tiles.py serve` for a local HTTP server:
+
+    http://localhost:8000/mandelbrot/3/2/3.pgm?max_iter=256
+    http://localhost:8000/julia/2/1/1.pgm?c=-0.7,0.27
+"""
+
+import hashlib
+import os
+import sys
+import tempfile
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import numpy as np  # pip install numpy
+
+from escape_time import escape_counts, in_main_bulbs, plane
+
+TILE = 64                    # pixels per tile side
+EXTENT = 2.0                 # zoom 0 covers [-EXTENT, EXTENT]²
+MAX_BYTES = 256 * 2 ** 20    # default cache budget
+CACHE_DIR = os.path.join(tempfile.gettempdir(), 'fractal_tiles')
+
+
+def tile_key(fractal, zoom, x, y, max_iter=256, c=None):
+    """The full name of a tile. c is only meaningful for Julia sets."""
+    if fractal == 'julia':
+        c = complex(c)
+        c = (c.real, c.imag)
+    elif fractal == 'mandelbrot':
+        c = None
+    else:
+        raise ValueError(f'unknown fractal: {fractal!r}')
+    if int(max_iter) < 1:
+        raise ValueError(f'max_iter must be at least 1, not {max_iter}')
+    return (fractal, c, int(zoom), int(x), int(y), int(max_iter))
+
+
+def tile_plane(zoom, x, y):
+    """The TILE × TILE grid of points covered by tile (x, y) at zoom.
+
+    Edges are half-open, so neighbouring tiles meet without overlap.
+    """
+    size = 2 * EXTENT / 2 ** zoom
+    left, top = -EXTENT + x * size, EXTENT - y * size
+    return plane(left, left + size, top - size, top, TILE, TILE,
+                 endpoint=False)
+
+
+def render_tile(key):
+    """Iteration counts for one tile. Runs in a worker process."""
+    fractal, c, zoom, x, y, max_iter = key
+    points = tile_plane(zoom, x, y)
+    if fractal == 'mandelbrot':
+        return escape_counts(0, points, max_iter,
+                             interior=in_main_bulbs(points))
+    return escape_counts(points, complex(*c), max_iter)
+
+
+class TileCache:
+    """Tiles on disk, filed under a hash of their key.
+
+    Least recently used tiles are evicted once the total size passes
+    max_bytes. Recency survives restarts through file modification times.
+    Several processes may share one directory: a tile another one wrote
+    is found on disk, and one it evicted is simply a miss.
+    """
+
+    def __init__(self, root=CACHE_DIR, max_bytes=MAX_BYTES):
+        self.root = root
+        self.max_bytes = max_bytes
+        self.lock = threading.Lock()
+        self.sizes = OrderedDict()
+        os.makedirs(root, exist_ok=True)
+        found = []
+        for dirpath, _, names in os.walk(root):
+            for name in names:
+                if name.endswith('.npy'):
+                    st = os.stat(os.path.join(dirpath, name))
+                    found.append((st.st_mtime, os.path.join(dirpath, name),
+                                  st.st_size))
+        for _, path, size in sorted(found):
+            self.sizes[path] = size
+        self.total = sum(self.sizes.values())
+
+    def path(self, key):
+        digest = hashlib.sha256(repr(key).encode()).hexdigest()
+        return os.path.join(self.root, digest[:2], digest + '.npy')
+
+    def get(self, key):
+        path = self.path(key)
+        with self.lock:
+            try:
+                os.utime(path)
+                counts = np.load(path)
+            except FileNotFoundError:
+                self.total -= self.sizes.pop(path, 0)
+                return None
+            if path not in self.sizes:
+                self.sizes[path] = os.path.getsize(path)
+                self.total += self.sizes[path]
+            self.sizes.move_to_end(path)
+        return counts
+
+    def put(self, key, counts):
+        path = self.path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+        with os.fdopen(fd, 'wb') as f:
+            np.save(f, counts)
+        os.replace(tmp, path)
+        with self.lock:
+            self.total += os.path.getsize(path) - self.sizes.pop(path, 0)
+            self.sizes[path] = os.path.getsize(path)
+            while self.total > self.max_bytes and len(self.sizes) > 1:
+                old, size = self.sizes.popitem(last=False)
+                self.total -= size
+                try:
+                    os.remove(old)
+                except FileNotFoundError:
+                    pass
+
+
+class TileServer:
+    """Hands out tiles: from the cache if possible, else from the pool.
+
+    A tile already being rendered for one request is shared with any
+    other request that wants it, rather than rendered again.
+    """
+
+    def __init__(self, cache=None, workers=None):
+        self.cache = cache if cache is not None else TileCache()
+        self.pool = ProcessPoolExecutor(workers)
+        self.pending = {}
+        self.lock = threading.Lock()
+        self.hits = self.misses = 0
+
+    def tiles(self, keys):
+        """A dict from each key to its counts array."""
+        found, waiting, submitted = {}, {}, set()
+        for key in dict.fromkeys(keys):
+            counts = self.cache.get(key)
+            with self.lock:
+                if counts is None and key not in self.pending:
+                    # It may have been finished since we looked
+                    counts = self.cache.get(key)
+                if counts is not None:
+                    self.hits += 1
+                    found[key] = counts
+                    continue
+                if key not in self.pending:
+                    self.misses += 1
+                    self.pending[key] = self.pool.submit(render_tile, key)
+                    submitted.add(key)
+                waiting[key] = self.pending[key]
+        for key, future in waiting.items():
+            try:
+                found[key] = future.result()
+                if key in submitted:
+                    # Cached before it stops being pending, so no request
+                    # finds it in neither place; the cache has its own lock
+                    self.cache.put(key, found[key])
+            finally:
+                # A failed render is forgotten too, so the next request
+                # for the tile tries again
+                if key in submitted:
+                    with self.lock:
+                        del self.pending[key]
+        return found
+
+    def view(self, fractal, zoom, x0, y0, cols, rows, max_iter=256, c=None):
+        """Counts for a block of cols × rows tiles, stitched together."""
+        keys = [[tile_key(fractal, zoom, x, y, max_iter, c)
+                 for x in range(x0, x0 + cols)]
+                for y in range(y0, y0 + rows)]
+        got = self.tiles(k for row in keys for k in row)
+        return np.block([[got[k] for k in row] for row in keys])
+
+    def close(self):
+        self.pool.shutdown()
+
+
+def to_pgm(counts, max_iter):
+    """A greyscale PGM image: the set black, fast escapes white."""
+    grey = (255 - counts.astype(np.int64) * 255 // max_iter).astype(np.uint8)
+    h, w = grey.shape
+    return f'P5 {w} {h} 255\n'.encode() + grey.tobytes()
+
+
+def serve(server, port=8000):
+    """GET /<fractal>/<zoom>/<x>/<y>.pgm?max_iter=N&c=re,im"""
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            url = urlparse(self.path)
+            query = parse_qs(url.query)
+            try:
+                fractal, zoom, x, y = url.path.strip('/').split('/')
+                max_iter = int(query.get('max_iter', ['256'])[0])
+                c = None
+                if 'c' in query:
+                    re_, im_ = query['c'][0].split(',')
+                    c = complex(float(re_), float(im_))
+                key = tile_key(fractal, zoom, x, y.removesuffix('.pgm'),
+                               max_iter, c)
+            except (ValueError, TypeError) as e:
+                self.send_error(400, str(e))
+                return
+            body = to_pgm(server.tiles([key])[key], max_iter)
+            self.send_response(200)
+            self.send_header('Content-Type', 'image/x-portable-graymap')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+    httpd = ThreadingHTTPServer(('localhost', port), Handler)
+    print(f'Serving tiles on http://localhost:{port}/  (Ctrl+C to stop)')
+    try:
+        httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    httpd.server_close()
+
+
+if __name__ == '__main__':
+    server = TileServer()
+    if sys.argv[1:] == ['serve']:
+        serve(server)
+    else:
+        CHARS = ' ·:;+=xX$&#█'
+        for x0, cols in ((0, 3), (1, 3), (0, 4)):
+            counts = server.view('mandelbrot', 2, x0, 0, cols, 4)
+            print(f'Zoom 2, tile columns {x0}–{x0 + cols - 1}:  '
+                  f'{server.misses} tiles rendered, {server.hits} '
+                  f'from cache so far')
+        print()
+        for line in counts[::8, ::4] * (len(CHARS) - 1) // 256:
+            print('  ' + ''.join(CHARS[i] for i in line))
+    server.close()
@@ -24,10 +24,16 @@ Objects shown:
 
 This is how all 3D graphics worked before hardware acceleration:
   project, clip, rasterize — in software, one vertex at a time.
+
+(The rasterizing here is done for all edges at once, by raster.py.)
 """
 
 import math
 
+import numpy as np  # pip install numpy
+
+from raster import draw
+
 WIDTH = 60
 HEIGHT = 28
 D_PERSP = 3.0  # perspective distance
@@ -55,28 +61,6 @@ def project(x, y, z, d=D_PERSP, scale=SCALE, w=WIDTH, h=HEIGHT):
     return int(sx), int(sy)
 
 
-def draw_line(grid, x0, y0, x1, y1, char='·', w=WIDTH, h=HEIGHT):
-    """Bresenham line drawing on a character grid."""
-    dx = abs(x1 - x0); dy = abs(y1 - y0)
-    sx = 1 if x0 < x1 else -1
-    sy = 1 if y0 < y1 else -1
-    err = dx - dy
-
-    steps = 0
-    while steps < 500:
-        if 0 <= x0 < w and 0 <= y0 < h:
-            if grid[y0][x0] == ' ':
-                grid[y0][x0] = char
-        if x0 == x1 and y0 == y1:
-            break
-        e2 = 2 * err
-        if e2 > -dy:
-            err -= dy; x0 += sx
-        if e2 < dx:
-            err += dx; y0 += sy
-        steps += 1
-
-
 def render_object(vertices, edges, rx, ry, rz, title):
     """Render a 3D wireframe at given rotation angles."""
     # Rotate all vertices
@@ -86,10 +70,9 @@ def render_object(vertices, edges, rx, ry, rz, title):
 
     # Draw
     grid = [[' '] * WIDTH for _ in range(HEIGHT)]
-    for i, j in edges:
-        x0, y0 = projected[i]
-        x1, y1 = projected[j]
-        draw_line(grid, x0, y0, x1, y1, '·')
+    segments = [projected[i] + projected[j] for i, j in edges]
+    for y, x in zip(*np.nonzero(draw(segments, WIDTH, HEIGHT) >= 0)):
+        grid[y][x] = '·'
 
     # Draw vertices
     for sx, sy in projected:
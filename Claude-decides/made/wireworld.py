@@ -13,8 +13,19 @@ The 1-or-2 rule means signals propagate without spontaneously multiplying.
 This is enough to build logic gates and, in principle, a computer.
 
 Below: three circuits demonstrating different behaviors.
+
+Each state counts electron heads around it and looks up what to become
+(multistate.py), so a whole circuit steps at once however big it is:
+`python wireworld.py big` runs a 1000 × 1000 board of loops.
 """
 
+import sys
+import time
+
+import numpy as np  # pip install numpy
+
+import multistate
+
 EMPTY, COPPER, HEAD, TAIL = 0, 1, 2, 3
 CH = {EMPTY: '·', COPPER: '░', HEAD: '█', TAIL: 'o'}
 
@@ -25,24 +36,22 @@ def blank():
     return [[EMPTY] * W for _ in range(H)]
 
 
+def rule():
+    """(watch, table) for multistate: every state counts HEAD neighbours."""
+    watch, table = multistate.rule(4)
+    watch[:] = HEAD
+    table[COPPER, 1:3] = HEAD
+    table[HEAD, :] = TAIL
+    table[TAIL, :] = COPPER
+    return watch, table
+
+
+RULE = rule()
+
+
 def step(grid):
-    new = [[EMPTY] * W for _ in range(H)]
-    for r in range(H):
-        for c in range(W):
-            s = grid[r][c]
-            if s == HEAD:
-                new[r][c] = TAIL
-            elif s == TAIL:
-                new[r][c] = COPPER
-            elif s == COPPER:
-                heads = sum(
-                    grid[r+dr][c+dc] == HEAD
-                    for dr in (-1, 0, 1) for dc in (-1, 0, 1)
-                    if (dr, dc) != (0, 0)
-                    and 0 <= r+dr < H and 0 <= c+dc < W
-                )
-                new[r][c] = HEAD if 1 <= heads <= 2 else COPPER
-    return new
+    # Off the edge of the board is empty, not wrapped round
+    return multistate.step(np.array(grid), *RULE, torus=False).tolist()
 
 
 def show(grid, label=''):
@@ -121,7 +130,47 @@ def demo_loop():
         g = step(g)
 
 
+# ── A large board: many loops at once ──────────────────────────────────────
+
+def big(size=1000, laps=10):
+    """Loops of the circuit 3 kind tiled over a size × size board, each
+    with an electron. After every lap the board must be as it was.
+
+    The electron cuts each corner diagonally, so a lap is four steps
+    shorter than the perimeter; and its very first step already cuts one,
+    so laps are counted from step 1.
+    """
+    LW, LH = 20, 5
+    period = 2 * (LW + LH - 2) - 4
+    loop = np.zeros((LH + 1, LW + 1), dtype=np.uint8)
+    loop[[0, LH - 1], :LW] = COPPER
+    loop[:LH, [0, LW - 1]] = COPPER
+    loop[0, 2], loop[0, 1] = HEAD, TAIL
+    reps = (size // (LH + 1), size // (LW + 1))
+    board = np.zeros((size, size), dtype=np.uint8)
+    tiled = np.tile(loop, reps)
+    board[:tiled.shape[0], :tiled.shape[1]] = tiled
+
+    print(f'{size}×{size} board, {reps[0] * reps[1]:,} loops, '
+          f'{np.sum(board != EMPTY):,} cells of wire\n')
+    start = time.perf_counter()
+    grid = board = multistate.step(board, *RULE, torus=False)
+    for lap in range(1, laps + 1):
+        grid = multistate.run(grid, *RULE, period, torus=False)
+        same = np.array_equal(grid, board)
+        print(f'  lap {lap:>2} (step {1 + lap * period:>4}):  '
+              f'{np.sum(grid == HEAD):,} heads,  same as step 1: {same}')
+    seconds = time.perf_counter() - start
+    steps = 1 + laps * period
+    print(f'\n{steps} steps in {seconds:.2f} s '
+          f'({size * size * steps / seconds:,.0f} cell-updates per second)')
+
+
 if __name__ == '__main__':
+    if sys.argv[1:] == ['big']:
+        big()
+        sys.exit()
+
     print('Wireworld')
     print('░=copper  █=electron head  o=tail  ·=empty\n')
     print('─' * 64)